@@ -6,6 +6,7 @@ across the crudadmin application, including password hashing, verification,
 and user authentication logic.
 """
 
+import asyncio
 import logging
 from typing import Any, Optional
 
@@ -14,11 +15,25 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
+_USER_FIELDS = (
+    "id",
+    "username",
+    "email",
+    "hashed_password",
+    "is_active",
+    "is_superuser",
+    "created_at",
+    "updated_at",
+)
+
 
 async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a password against its hash using bcrypt.
 
+    The bcrypt check runs in a worker thread so it does not block the event
+    loop while other requests are served.
+
     Args:
         plain_password: The plaintext password to verify
         hashed_password: The bcrypt hashed password to check against
@@ -27,7 +42,9 @@ async def verify_password(plain_password: str, hashed_password: str) -> bool:
         True if the password matches, False otherwise
     """
     try:
-        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+        return await asyncio.to_thread(
+            bcrypt.checkpw, plain_password.encode(), hashed_password.encode()
+        )
     except Exception as e:
         logger.error(f"Error verifying password: {str(e)}")
         return False
@@ -71,23 +88,11 @@ def convert_user_to_dict(user_obj: Any) -> Optional[dict]:
 
     if hasattr(user_obj, "__dict__"):
         try:
-            user_dict = {}
-
-            common_attrs = [
-                "id",
-                "username",
-                "email",
-                "hashed_password",
-                "is_active",
-                "is_superuser",
-                "created_at",
-                "updated_at",
-            ]
-
-            for attr in common_attrs:
-                if hasattr(user_obj, attr):
-                    user_dict[attr] = getattr(user_obj, attr)
-
+            user_dict = {
+                field: getattr(user_obj, field)
+                for field in _USER_FIELDS
+                if hasattr(user_obj, field)
+            }
             return user_dict if user_dict else None
 
         except Exception as e:
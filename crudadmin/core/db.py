@@ -138,16 +138,21 @@ class DatabaseConfig:
                 "AdminSessionRead",
             ]
         ] = None,
+        admin_engine: Optional[AsyncEngine] = None,
     ) -> None:
         self.base: Type[DeclarativeBase] = base
         self.session: Callable[[], AsyncGenerator[AsyncSession, None]] = session
 
-        if admin_db_url is None:
-            if admin_db_path is None:
-                admin_db_path = get_default_db_path()
-            admin_db_url = f"sqlite+aiosqlite:///{admin_db_path}"
+        # An engine passed in is used as-is (and shared); otherwise one is
+        # created from admin_db_url, falling back to a local SQLite file.
+        if admin_engine is None:
+            if admin_db_url is None:
+                if admin_db_path is None:
+                    admin_db_path = get_default_db_path()
+                admin_db_url = f"sqlite+aiosqlite:///{admin_db_path}"
+            admin_engine = create_async_engine(admin_db_url)
 
-        self.admin_engine: AsyncEngine = create_async_engine(admin_db_url)
+        self.admin_engine: AsyncEngine = admin_engine
         self.admin_session: AsyncSession = AsyncSession(
             self.admin_engine, expire_on_commit=False
         )
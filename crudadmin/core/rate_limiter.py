@@ -1,9 +1,16 @@
 """Simple rate limiter implementation using session storage backends."""
 
+import asyncio
 import logging
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, ValidationError, field_validator
 
+from ..session.backends.memory import MemorySessionStorage
+from ..session.backends.redis import RedisSessionStorage
 from ..session.storage import AbstractSessionStorage, get_session_storage
 
 logger = logging.getLogger(__name__)
@@ -12,20 +19,80 @@ logger = logging.getLogger(__name__)
 class RateLimitData(BaseModel):
     """Data model for rate limit counters."""
 
+    model_config = ConfigDict(frozen=True)
+
     count: int = 0
-    first_attempt: float
+    # Window start in milliseconds on the limiter's clock.
+    first_attempt: int
+
+    @field_validator("first_attempt", mode="before")
+    @classmethod
+    def _legacy_seconds_to_ms(cls, value: Any) -> Any:
+        """Read counters written as float epoch seconds by older versions."""
+        if isinstance(value, float):
+            return int(value * 1000)
+        return value
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitDecision:
+    """Outcome of a single rate limit check.
+
+    Attributes:
+        count: The counter value after this call's increment.
+        over_limit: Whether the count exceeds the limit.
+        retry_after_ms: Milliseconds until the window resets when over the
+            limit, otherwise 0.
+    """
+
+    count: int
+    over_limit: bool
+    retry_after_ms: int
+
+
+def _monotonic_ms() -> int:
+    """Milliseconds on the monotonic clock; unaffected by NTP adjustments."""
+    return time.monotonic_ns() // 1_000_000
+
+
+def _wall_clock_ms() -> int:
+    """Milliseconds since the epoch, comparable across processes and hosts."""
+    return time.time_ns() // 1_000_000
 
 
 class SimpleRateLimiter:
     """Simple rate limiter using session storage backends."""
 
-    def __init__(self, storage: AbstractSessionStorage[RateLimitData]):
+    def __init__(
+        self,
+        storage: AbstractSessionStorage[RateLimitData],
+        time_func: Optional[Callable[[], int]] = None,
+    ):
         """Initialize the rate limiter.
 
         Args:
             storage: The storage backend to use for rate limiting
+            time_func: Millisecond clock used to timestamp and expire windows.
+                Defaults to the monotonic clock for in-process memory storage
+                and to wall-clock time for storages shared between processes.
         """
         self.storage = storage
+        if time_func is None:
+            time_func = (
+                _monotonic_ms
+                if isinstance(storage, MemorySessionStorage)
+                else _wall_clock_ms
+            )
+        self._now = time_func
+        # Redis counts with one atomic script call; other backends fall back to
+        # read-modify-write, serialized per key within this process. A lock
+        # lives only while some caller holds or waits on it.
+        self._redis_storage: Optional[RedisSessionStorage[RateLimitData]] = (
+            storage if isinstance(storage, RedisSessionStorage) else None
+        )
+        self._locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
 
     async def increment(
         self, key: str, increment_value: int, expiry_seconds: int
@@ -40,27 +107,127 @@ class SimpleRateLimiter:
         Returns:
             Current count for the key after increment
         """
-        import time
+        if self._redis_storage is not None:
+            return await self._redis_storage.increment_counter(
+                key, increment_value, expiry_seconds
+            )
+
+        data = await self._increment(key, increment_value, expiry_seconds)
+        return data.count
+
+    async def check_and_increment(
+        self, key: str, limit: int, window: int, amount: int = 1
+    ) -> RateLimitDecision:
+        """Increment the counter for a key and check it against a limit.
+
+        On Redis the count and the remaining window come back from the same
+        single round-trip as the increment.
 
-        current_time = time.time()
+        Args:
+            key: The rate limit key
+            limit: Maximum count allowed within the window
+            window: Window length in seconds
+            amount: Amount to increment (typically 1)
 
-        existing = await self.storage.get(key, RateLimitData)
+        Returns:
+            The new count, whether it is over the limit, and when to retry
+        """
+        if self._redis_storage is not None:
+            count, remaining_ms = await self._redis_storage.increment_counter_with_ttl(
+                key, amount, window
+            )
+        else:
+            data = await self._increment(key, amount, window)
+            count = data.count
+            remaining_ms = window * 1000 - (self._now() - data.first_attempt)
 
+        over_limit = count > limit
+        return RateLimitDecision(
+            count=count,
+            over_limit=over_limit,
+            retry_after_ms=max(remaining_ms, 0) if over_limit else 0,
+        )
+
+    async def _get_data(self, key: str) -> Optional[RateLimitData]:
+        """Read a counter, treating one that cannot be parsed as absent.
+
+        Raising here would make callers fail open, so an unreadable counter
+        starts a new window instead.
+        """
+        try:
+            return await self.storage.get(key, RateLimitData)
+        except ValidationError as e:
+            logger.warning(f"Ignoring unreadable rate limit counter {key}: {e}")
+            return None
+
+    def _key_lock(self, key: str) -> asyncio.Lock:
+        """Return the lock serializing read-modify-write on ``key``."""
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        return lock
+
+    async def _increment(
+        self, key: str, increment_value: int, expiry_seconds: int
+    ) -> RateLimitData:
+        async with self._key_lock(key):
+            return await self._increment_unlocked(key, increment_value, expiry_seconds)
+
+    async def _increment_unlocked(
+        self, key: str, increment_value: int, expiry_seconds: int
+    ) -> RateLimitData:
+        current_time = self._now()
+
+        existing = await self._get_data(key)
+
+        # Values built here come from trusted ints, so skip validation.
         if existing is None:
-            new_data = RateLimitData(count=increment_value, first_attempt=current_time)
+            new_data = RateLimitData.model_construct(
+                count=increment_value, first_attempt=current_time
+            )
             await self.storage.create(
                 new_data, session_id=key, expiration=expiry_seconds
             )
-            return increment_value
+            return new_data
 
-        if current_time - existing.first_attempt > expiry_seconds:
-            new_data = RateLimitData(count=increment_value, first_attempt=current_time)
+        if current_time - existing.first_attempt > expiry_seconds * 1000:
+            new_data = RateLimitData.model_construct(
+                count=increment_value, first_attempt=current_time
+            )
             await self.storage.update(key, new_data, expiration=expiry_seconds)
-            return increment_value
+            return new_data
+
+        updated = RateLimitData.model_construct(
+            count=existing.count + increment_value,
+            first_attempt=existing.first_attempt,
+        )
+        await self.storage.update(key, updated, reset_expiration=False)
+        return updated
+
+    async def increment_many(
+        self, keys: list[str], increment_value: int, expiry_seconds: int
+    ) -> list[int]:
+        """Increment the counters for several keys at once.
+
+        On Redis all increments are sent in one pipelined round-trip.
+
+        Args:
+            keys: The rate limit keys
+            increment_value: Amount to increment each counter by
+            expiry_seconds: Expiry time in seconds
+
+        Returns:
+            Current count for each key after increment, in the order of ``keys``
+        """
+        if self._redis_storage is not None:
+            return await self._redis_storage.increment_counters(
+                keys, increment_value, expiry_seconds
+            )
 
-        existing.count += increment_value
-        await self.storage.update(key, existing, reset_expiration=False)
-        return existing.count
+        return [
+            (await self._increment(key, increment_value, expiry_seconds)).count
+            for key in keys
+        ]
 
     async def delete(self, key: str) -> None:
         """Delete a rate limit key.
@@ -79,14 +246,138 @@ class SimpleRateLimiter:
         Returns:
             Current count (0 if key doesn't exist)
         """
-        data = await self.storage.get(key, RateLimitData)
+        if self._redis_storage is not None:
+            return await self._redis_storage.get_counter(key)
+
+        data = await self._get_data(key)
         return data.count if data else 0
 
+    async def get_counts(self, keys: list[str]) -> list[int]:
+        """Get current counts for several keys.
+
+        Args:
+            keys: The rate limit keys
+
+        Returns:
+            Current count for each key (0 if it doesn't exist), in order
+        """
+        if self._redis_storage is not None:
+            return await self._redis_storage.get_counters(keys)
+
+        return [await self.get_count(key) for key in keys]
+
     async def close(self) -> None:
         """Close the storage connection."""
         await self.storage.close()
 
 
+# (expiry_seconds, key) -> waiting callers and their amounts, in arrival order
+_PendingIncrements = dict[tuple[int, str], list[tuple[asyncio.Future[int], int]]]
+
+
+class BatchingRateLimiter(SimpleRateLimiter):
+    """Rate limiter that coalesces concurrent Redis increments.
+
+    Increments made within ``batch_window`` seconds of each other are summed
+    per key and sent as one pipelined round-trip, with each caller receiving
+    the count its own increment produced. Other backends have no round-trip
+    to save and behave exactly like ``SimpleRateLimiter``.
+    """
+
+    def __init__(
+        self,
+        storage: AbstractSessionStorage[RateLimitData],
+        time_func: Optional[Callable[[], int]] = None,
+        batch_window: float = 0.0005,
+    ):
+        """Initialize the batching rate limiter.
+
+        Args:
+            storage: The storage backend to use for rate limiting
+            time_func: Millisecond clock used to timestamp and expire windows
+            batch_window: Seconds to collect increments before sending them
+        """
+        super().__init__(storage, time_func)
+        self.batch_window = batch_window
+        self._pending: _PendingIncrements = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+
+    async def increment(
+        self, key: str, increment_value: int, expiry_seconds: int
+    ) -> int:
+        """Queue an increment for the next batch and wait for its count.
+
+        Args:
+            key: The rate limit key
+            increment_value: Amount to increment (typically 1)
+            expiry_seconds: Expiry time in seconds
+
+        Returns:
+            Count for the key right after this increment was applied
+        """
+        if self._redis_storage is None:
+            return await super().increment(key, increment_value, expiry_seconds)
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[int] = loop.create_future()
+        self._pending.setdefault((expiry_seconds, key), []).append(
+            (future, increment_value)
+        )
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        """Hand the pending increments to a task that sends them."""
+        self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        task = asyncio.ensure_future(self._send(pending))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _send(self, pending: _PendingIncrements) -> None:
+        """Send one summed increment per key and resolve the waiting callers."""
+        storage = self._redis_storage
+        if storage is None:
+            return
+
+        by_expiry: dict[int, list[str]] = {}
+        for expiry_seconds, key in pending:
+            by_expiry.setdefault(expiry_seconds, []).append(key)
+
+        for expiry_seconds, keys in by_expiry.items():
+            waiters = [pending[(expiry_seconds, key)] for key in keys]
+            totals = [sum(amount for _, amount in calls) for calls in waiters]
+            try:
+                counts = await storage.increment_counters(keys, totals, expiry_seconds)
+            except Exception as e:
+                for calls in waiters:
+                    for future, _ in calls:
+                        if not future.done():
+                            future.set_exception(e)
+                continue
+
+            # Hand out the counts in arrival order, as if applied one by one
+            for calls, total, count in zip(waiters, totals, counts):
+                running = count - total
+                for future, amount in calls:
+                    running += amount
+                    if not future.done():
+                        future.set_result(running)
+
+    async def close(self) -> None:
+        """Send any queued increments, then close the storage connection."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush()
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks)
+        await super().close()
+
+
 def create_rate_limiter(backend: str, **backend_kwargs) -> SimpleRateLimiter:
     """Create a rate limiter using the specified backend.
 
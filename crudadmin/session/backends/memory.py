@@ -1,3 +1,4 @@
+import heapq
 import json
 import logging
 import re
@@ -31,6 +32,10 @@ class MemorySessionStorage(AbstractSessionStorage[T]):
         super().__init__(prefix=prefix, expiration=expiration)
         self.data: dict[str, bytes] = {}
         self.expiry: dict[str, datetime] = {}
+        # Keys bucketed by the second they expire in, plus a min-heap of bucket
+        # seconds, so expired keys are dropped without scanning every key.
+        self._expiry_buckets: dict[int, set[str]] = {}
+        self._bucket_heap: list[int] = []
 
     async def create(
         self,
@@ -60,8 +65,9 @@ class MemorySessionStorage(AbstractSessionStorage[T]):
             json_data.encode("utf-8") if isinstance(json_data, str) else json_data
         )
 
+        self._sweep_expired()
         self.data[key] = value_bytes
-        self.expiry[key] = datetime.now(UTC) + timedelta(seconds=exp)
+        self._set_expiry(key, datetime.now(UTC) + timedelta(seconds=exp))
 
         logger.debug(f"Created session {session_id} with expiration {exp}s")
         return session_id
@@ -86,13 +92,9 @@ class MemorySessionStorage(AbstractSessionStorage[T]):
             return None
 
         try:
-            data_str = (
-                data_bytes.decode("utf-8")
-                if isinstance(data_bytes, bytes)
-                else data_bytes
-            )
-            json_data = json.loads(data_str)
-            return model_class.model_validate(json_data)
+            # Parse and validate in one pass inside pydantic-core, without
+            # building an intermediate dict through the json module.
+            return model_class.model_validate_json(data_bytes)
         except (json.JSONDecodeError, ValueError) as e:
             logger.error(f"Error parsing session data: {e}")
             return None
@@ -117,6 +119,7 @@ class MemorySessionStorage(AbstractSessionStorage[T]):
         """
         key = self.get_key(session_id)
 
+        self._sweep_expired()
         if key not in self.data or self._check_expiry(key):
             return False
 
@@ -129,7 +132,7 @@ class MemorySessionStorage(AbstractSessionStorage[T]):
 
         if reset_expiration:
             exp = expiration if expiration is not None else self.expiration
-            self.expiry[key] = datetime.now(UTC) + timedelta(seconds=exp)
+            self._set_expiry(key, datetime.now(UTC) + timedelta(seconds=exp))
 
         return True
 
@@ -164,8 +167,9 @@ class MemorySessionStorage(AbstractSessionStorage[T]):
         key = self.get_key(session_id)
         exp = expiration if expiration is not None else self.expiration
 
+        self._sweep_expired()
         if key in self.data and not self._check_expiry(key):
-            self.expiry[key] = datetime.now(UTC) + timedelta(seconds=exp)
+            self._set_expiry(key, datetime.now(UTC) + timedelta(seconds=exp))
             return True
         return False
 
@@ -208,6 +212,36 @@ class MemorySessionStorage(AbstractSessionStorage[T]):
                 key for key in list(self.data.keys()) if not self._check_expiry(key)
             ]
 
+    def _set_expiry(self, key: str, expires_at: datetime) -> None:
+        """Record a key's expiry time and file it in its expiry bucket.
+
+        Args:
+            key: The key to expire
+            expires_at: When the key expires
+        """
+        self.expiry[key] = expires_at
+        bucket = int(expires_at.timestamp())
+        keys = self._expiry_buckets.get(bucket)
+        if keys is None:
+            self._expiry_buckets[bucket] = keys = set()
+            heapq.heappush(self._bucket_heap, bucket)
+        keys.add(key)
+
+    def _sweep_expired(self) -> None:
+        """Drop keys from every expiry bucket that is already in the past.
+
+        Runs on every write (create, update and extend), since each of those
+        files a key into a new bucket. Work is proportional to the number of
+        due keys, not the total key count.
+        Keys that were deleted or re-extended since being bucketed are skipped
+        by ``_check_expiry``.
+        """
+        now_bucket = int(datetime.now(UTC).timestamp())
+        while self._bucket_heap and self._bucket_heap[0] < now_bucket:
+            bucket = heapq.heappop(self._bucket_heap)
+            for key in self._expiry_buckets.pop(bucket, ()):
+                self._check_expiry(key)
+
     def _check_expiry(self, key: str) -> bool:
         """Check if a key has expired and remove it if so.
 
@@ -227,6 +261,8 @@ class MemorySessionStorage(AbstractSessionStorage[T]):
         """Clear all data."""
         self.data.clear()
         self.expiry.clear()
+        self._expiry_buckets.clear()
+        self._bucket_heap.clear()
 
     async def delete_pattern(self, pattern: str) -> int:
         """Delete all keys matching a pattern.
@@ -1,25 +1,44 @@
 import json
 import logging
-from typing import TYPE_CHECKING, Optional, TypeVar
+import weakref
+from typing import TYPE_CHECKING, Optional, TypeVar, Union
 
 from pydantic import BaseModel
 
 from ..storage import AbstractSessionStorage
 
 if TYPE_CHECKING:
-    from redis.asyncio import Redis
+    from redis.asyncio import ConnectionPool, Redis
     from redis.exceptions import RedisError
 
 T = TypeVar("T", bound=BaseModel)
 logger = logging.getLogger(__name__)
 
+# Adds ARGV[1] to a counter and starts its ARGV[2] ms window on the first hit.
+# Values left in another format (e.g. JSON) are replaced by a fresh counter.
+# Returns the new count and the milliseconds left in the window.
+_INCREMENT_COUNTER_LUA = """
+local count = redis.pcall('INCRBY', KEYS[1], ARGV[1])
+if type(count) == 'table' and count.err then
+    redis.call('DEL', KEYS[1])
+    count = redis.call('INCRBY', KEYS[1], ARGV[1])
+end
+local ttl = redis.call('PTTL', KEYS[1])
+if ttl < 0 then
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+    ttl = tonumber(ARGV[2])
+end
+return {count, ttl}
+"""
+
 try:
     from redis.asyncio import Redis
-    from redis.exceptions import RedisError
+    from redis.exceptions import NoScriptError, RedisError
 
     REDIS_AVAILABLE = True
 except ImportError:
     Redis = None  # type: ignore
+    NoScriptError = None  # type: ignore
     RedisError = None  # type: ignore
     REDIS_AVAILABLE = False
 
@@ -27,6 +46,12 @@ except ImportError:
 class RedisSessionStorage(AbstractSessionStorage[T]):
     """Redis implementation of session storage."""
 
+    # SHA of the counter script per connection pool, shared by every storage
+    # on that pool so the script is loaded once rather than once per storage.
+    _counter_script_shas: "weakref.WeakKeyDictionary[ConnectionPool, str]" = (
+        weakref.WeakKeyDictionary()
+    )
+
     def __init__(
         self,
         prefix: str = "session:",
@@ -38,6 +63,7 @@ class RedisSessionStorage(AbstractSessionStorage[T]):
         password: Optional[str] = None,
         pool_size: int = 10,
         connect_timeout: int = 10,
+        connection_pool: Optional["ConnectionPool"] = None,
     ):
         """Initialize the Redis session storage.
 
@@ -51,6 +77,9 @@ class RedisSessionStorage(AbstractSessionStorage[T]):
             password: Redis password
             pool_size: Redis connection pool size
             connect_timeout: Redis connection timeout
+            connection_pool: Existing pool to share with other clients. When
+                given, the connection arguments above are ignored and closing
+                this storage leaves the pool open.
         """
         if not REDIS_AVAILABLE:
             raise ImportError(
@@ -62,18 +91,21 @@ class RedisSessionStorage(AbstractSessionStorage[T]):
 
         super().__init__(prefix=prefix, expiration=expiration)
 
-        self.client = Redis(
-            host=host,
-            port=port,
-            db=db,
-            username=username,
-            password=password,
-            socket_timeout=connect_timeout,
-            socket_connect_timeout=connect_timeout,
-            socket_keepalive=True,
-            decode_responses=False,
-            max_connections=pool_size,
-        )
+        if connection_pool is not None:
+            self.client = Redis(connection_pool=connection_pool)
+        else:
+            self.client = Redis(
+                host=host,
+                port=port,
+                db=db,
+                username=username,
+                password=password,
+                socket_timeout=connect_timeout,
+                socket_connect_timeout=connect_timeout,
+                socket_keepalive=True,
+                decode_responses=False,
+                max_connections=pool_size,
+            )
 
         self.user_sessions_prefix = f"{prefix}user:"
 
@@ -249,7 +281,7 @@ class RedisSessionStorage(AbstractSessionStorage[T]):
 
             try:
                 json_data = json.loads(data)
-                if "user_id" in json_data:
+                if isinstance(json_data, dict) and "user_id" in json_data:
                     user_id = json_data["user_id"]
                     user_sessions_key = self.get_user_sessions_key(user_id)
                     pipeline.srem(user_sessions_key, session_id)
@@ -324,6 +356,182 @@ class RedisSessionStorage(AbstractSessionStorage[T]):
             logger.error(f"Error checking session existence: {e}")
             raise
 
+    async def increment_counter(self, key_id: str, amount: int, expiration: int) -> int:
+        """Atomically increment a counter key in a single round-trip.
+
+        The counter expires ``expiration`` seconds after its first increment.
+
+        Args:
+            key_id: The counter ID (prefixed like a session ID)
+            amount: Amount to add to the counter
+            expiration: Window length in seconds
+
+        Returns:
+            The counter value after the increment
+
+        Raises:
+            RedisError: If there is an error with Redis
+        """
+        count, _ = await self.increment_counter_with_ttl(key_id, amount, expiration)
+        return count
+
+    async def increment_counter_with_ttl(
+        self, key_id: str, amount: int, expiration: int
+    ) -> tuple[int, int]:
+        """Atomically increment a counter key and read its remaining window.
+
+        Args:
+            key_id: The counter ID (prefixed like a session ID)
+            amount: Amount to add to the counter
+            expiration: Window length in seconds
+
+        Returns:
+            Tuple of (counter value after the increment, milliseconds until the
+            counter expires)
+
+        Raises:
+            RedisError: If there is an error with Redis
+        """
+        key = self.get_key(key_id)
+        args = (amount, expiration * 1000)
+
+        try:
+            sha = await self._load_counter_script()
+            try:
+                count, ttl = await self.client.evalsha(sha, 1, key, *args)
+            except NoScriptError:
+                sha = await self._load_counter_script(reload=True)
+                count, ttl = await self.client.evalsha(sha, 1, key, *args)
+            return int(count), int(ttl)
+        except self.RedisError as e:
+            logger.error(f"Error incrementing counter: {e}")
+            raise
+
+    async def increment_counters(
+        self, key_ids: list[str], amount: Union[int, list[int]], expiration: int
+    ) -> list[int]:
+        """Increment several counter keys in one pipelined round-trip.
+
+        Args:
+            key_ids: The counter IDs, in order
+            amount: Amount to add to each counter, or one amount per key
+            expiration: Window length in seconds
+
+        Returns:
+            The counter values after the increment, in the order of ``key_ids``
+
+        Raises:
+            RedisError: If there is an error with Redis
+        """
+        if not key_ids:
+            return []
+
+        amounts = [amount] * len(key_ids) if isinstance(amount, int) else amount
+        increments = [
+            (self.get_key(key_id), key_amount)
+            for key_id, key_amount in zip(key_ids, amounts)
+        ]
+        expiration_ms = expiration * 1000
+
+        try:
+            sha = await self._load_counter_script()
+            try:
+                results = await self._evalsha_pipeline(sha, increments, expiration_ms)
+            except NoScriptError:
+                # The script was flushed, so none of the calls ran; reload it
+                # and replay the whole pipeline once.
+                sha = await self._load_counter_script(reload=True)
+                results = await self._evalsha_pipeline(sha, increments, expiration_ms)
+            return [int(count) for count, _ in results]
+        except self.RedisError as e:
+            logger.error(f"Error incrementing counters: {e}")
+            raise
+
+    async def get_counter(self, key_id: str) -> int:
+        """Get the value of a counter key.
+
+        Args:
+            key_id: The counter ID
+
+        Returns:
+            The counter value, or 0 if the key doesn't exist
+
+        Raises:
+            RedisError: If there is an error with Redis
+        """
+        key = self.get_key(key_id)
+
+        try:
+            value = await self.client.get(key)
+        except self.RedisError as e:
+            logger.error(f"Error getting counter: {e}")
+            raise
+        return self._parse_counter(key, value)
+
+    async def get_counters(self, key_ids: list[str]) -> list[int]:
+        """Get the values of several counter keys with a single MGET.
+
+        Args:
+            key_ids: The counter IDs, in order
+
+        Returns:
+            The counter values (0 for missing keys), in the order of ``key_ids``
+
+        Raises:
+            RedisError: If there is an error with Redis
+        """
+        if not key_ids:
+            return []
+
+        try:
+            keys = [self.get_key(k) for k in key_ids]
+            values = await self.client.mget(keys)
+        except self.RedisError as e:
+            logger.error(f"Error getting counters: {e}")
+            raise
+        return [self._parse_counter(key, value) for key, value in zip(keys, values)]
+
+    @staticmethod
+    def _parse_counter(key: str, value: Optional[bytes]) -> int:
+        """Read a stored counter value, treating one that is not an integer as 0.
+
+        Older releases stored rate limit counters as JSON; the counter script
+        replaces such a value on the next increment, so until then it reads as
+        a fresh window rather than raising.
+        """
+        if value is None:
+            return 0
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring non-integer counter {key}: {value!r}")
+            return 0
+
+    async def _load_counter_script(self, reload: bool = False) -> str:
+        """Return the counter script's SHA, loading it on first use per pool.
+
+        Args:
+            reload: Load the script again, e.g. after a NOSCRIPT error
+
+        Returns:
+            The SHA1 to pass to EVALSHA
+        """
+        pool = self.client.connection_pool
+        sha = self._counter_script_shas.get(pool)
+        if sha is None or reload:
+            sha = await self.client.script_load(_INCREMENT_COUNTER_LUA)
+            self._counter_script_shas[pool] = sha
+        return sha
+
+    async def _evalsha_pipeline(
+        self, sha: str, increments: list[tuple[str, int]], expiration_ms: int
+    ) -> list:
+        """Run the counter script for each key in one non-transactional pipeline."""
+        pipeline = self.client.pipeline(transaction=False)
+        for key, amount in increments:
+            pipeline.evalsha(sha, 1, key, amount, expiration_ms)
+        return await pipeline.execute()
+
     async def get_user_sessions(self, user_id: int) -> list[str]:
         """Get all session IDs for a user.
 
@@ -189,6 +189,7 @@ def get_session_storage(
                 "password",
                 "pool_size",
                 "connect_timeout",
+                "connection_pool",
             ]
         }
         return RedisSessionStorage(**redis_kwargs)
@@ -1,20 +1,69 @@
 from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch, sentinel
 
 import pytest
 from fastapi import HTTPException, Request, status
 
 from crudadmin.session.manager import SessionManager
-from crudadmin.session.schemas import SessionData
+
+pytestmark = pytest.mark.fast_mocks
 
 UTC = timezone.utc
 
+_STATUS_401 = status.HTTP_401_UNAUTHORIZED
+_STATUS_403 = status.HTTP_403_FORBIDDEN
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
 
 class CSRFException(HTTPException):
     """Custom exception for CSRF validation failures."""
 
     def __init__(self, detail: str):
-        super().__init__(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+        super().__init__(status_code=_STATUS_403, detail=detail)
+
+
+def _recorder(calls, result=None):
+    """Build a side effect that records call arguments and returns ``result``."""
+
+    def record(*args, **kwargs):
+        calls.append((args, kwargs))
+        return result
+
+    return record
+
+
+async def _get_session_from_cookie(request, session_manager):
+    """Mock implementation of getting session from cookie."""
+    session_id = request.cookies.get("session_id")
+    if not session_id:
+        raise HTTPException(
+            status_code=_STATUS_401,
+            detail="Not authenticated",
+        )
+
+    session_data = await session_manager.validate_session(session_id)
+    if not session_data:
+        raise HTTPException(
+            status_code=_STATUS_401,
+            detail="Invalid or expired session",
+        )
+
+    return session_data
+
+
+async def _verify_csrf_token(request, session_data, session_manager):
+    """Mock implementation of CSRF token verification."""
+    method = request.method
+    if method in _SAFE_METHODS or not session_data:
+        return
+
+    token = request.headers.get("X-CSRF-Token")
+    if not token:
+        raise CSRFException("CSRF token missing")
+
+    is_valid = await session_manager.validate_csrf_token(session_data.session_id, token)
+    if not is_valid:
+        raise CSRFException("Invalid CSRF token")
 
 
 @pytest.fixture
@@ -28,19 +77,10 @@ def mock_request():
     return request
 
 
-@pytest.fixture
-def mock_session_data():
-    """Create mock session data for testing."""
-    return SessionData(
-        session_id="test-session-id",
-        user_id=1,
-        is_active=True,
-        ip_address="127.0.0.1",
-        user_agent="test-agent",
-        device_info={},
-        last_activity=datetime.now(UTC),
-        metadata={},
-    )
+@pytest.fixture(scope="session")
+def admin_user_data_with_id(admin_user_data):
+    """Admin user data with a primary key, as returned by authentication."""
+    return {**admin_user_data, "id": 1}
 
 
 @pytest.fixture
@@ -65,13 +105,17 @@ class TestAuthenticationEndpoints:
 
     @pytest.mark.asyncio
     async def test_login_success(
-        self, mock_session_manager, admin_user_data, mock_session_request
+        self,
+        mock_session_manager,
+        admin_user_data,
+        admin_user_data_with_id,
+        mock_session_request,
     ):
         """Test successful login with session authentication."""
         # Mock successful session creation
         mock_session_manager.create_session.return_value = (
-            "test-session-id",
-            "test-csrf-token",
+            sentinel.session_id,
+            sentinel.csrf_token,
         )
         mock_session_manager.track_login_attempt.return_value = (True, 5)
 
@@ -79,9 +123,6 @@ class TestAuthenticationEndpoints:
         username = admin_user_data["username"]
         password = "password123"
 
-        # Add id to admin_user_data for testing
-        admin_user_data_with_id = {**admin_user_data, "id": 1}
-
         # Mock the authentication logic
         with patch(
             "crudadmin.admin_user.service.AdminUserService.authenticate_user"
@@ -103,8 +144,8 @@ class TestAuthenticationEndpoints:
                 },
             )
 
-            assert session_id == "test-session-id"
-            assert csrf_token == "test-csrf-token"
+            assert session_id is sentinel.session_id
+            assert csrf_token is sentinel.csrf_token
 
             # Verify session creation was called
             mock_session_manager.create_session.assert_called_once()
@@ -132,15 +173,14 @@ class TestAuthenticationEndpoints:
     async def test_logout_endpoint(self, mock_session_manager, mock_session_data):
         """Test logout endpoint."""
         session_id = "test-session-id"
-        mock_session_manager.terminate_session.return_value = True
+        calls = []
+        mock_session_manager.terminate_session.side_effect = _recorder(calls, True)
 
         # Simulate logout endpoint behavior
         if session_id:
             await mock_session_manager.terminate_session(session_id=session_id)
 
-        mock_session_manager.terminate_session.assert_called_once_with(
-            session_id=session_id
-        )
+        assert calls == [((), {"session_id": session_id})]
 
         # Verify session cookies would be cleared
         # (This would be done in the actual endpoint)
@@ -155,7 +195,10 @@ class TestAuthenticationEndpoints:
         user_id = 1
         new_csrf_token = "new-csrf-token"
 
-        mock_session_manager.regenerate_csrf_token.return_value = new_csrf_token
+        calls = []
+        mock_session_manager.regenerate_csrf_token.side_effect = _recorder(
+            calls, new_csrf_token
+        )
 
         # Simulate CSRF refresh endpoint behavior
         result_token = await mock_session_manager.regenerate_csrf_token(
@@ -164,10 +207,7 @@ class TestAuthenticationEndpoints:
         )
 
         assert result_token == new_csrf_token
-        mock_session_manager.regenerate_csrf_token.assert_called_once_with(
-            user_id=user_id,
-            session_id=session_id,
-        )
+        assert calls == [((), {"user_id": user_id, "session_id": session_id})]
 
     @pytest.mark.asyncio
     async def test_unauthorized_access(self, mock_session_manager):
@@ -184,14 +224,14 @@ class TestAuthenticationEndpoints:
 
     @pytest.mark.asyncio
     async def test_protected_endpoint_access(
-        self, mock_session_manager, mock_session_data, admin_user_data
+        self, mock_session_manager, mock_session_data, admin_user_data_with_id
     ):
         """Test accessing protected endpoint with valid session."""
         session_id = "test-session-id"
-        mock_session_manager.validate_session.return_value = mock_session_data
-
-        # Add id to admin_user_data for testing
-        admin_user_data_with_id = {**admin_user_data, "id": 1}
+        calls = []
+        mock_session_manager.validate_session.side_effect = _recorder(
+            calls, mock_session_data
+        )
 
         # Simulate protected endpoint access
         session_data = await mock_session_manager.validate_session(session_id)
@@ -200,7 +240,7 @@ class TestAuthenticationEndpoints:
         assert session_data.user_id == admin_user_data_with_id["id"]
         assert session_data.is_active is True
 
-        mock_session_manager.validate_session.assert_called_once_with(session_id)
+        assert calls == [((session_id,), {})]
 
     @pytest.mark.asyncio
     async def test_csrf_protection_valid_token(
@@ -210,7 +250,8 @@ class TestAuthenticationEndpoints:
         session_id = "test-session-id"
         csrf_token = "test-csrf-token"
 
-        mock_session_manager.validate_csrf_token.return_value = True
+        calls = []
+        mock_session_manager.validate_csrf_token.side_effect = _recorder(calls, True)
 
         # Simulate CSRF validation
         is_valid = await mock_session_manager.validate_csrf_token(
@@ -218,9 +259,7 @@ class TestAuthenticationEndpoints:
         )
 
         assert is_valid is True
-        mock_session_manager.validate_csrf_token.assert_called_once_with(
-            session_id, csrf_token
-        )
+        assert calls == [((session_id, csrf_token), {})]
 
     @pytest.mark.asyncio
     async def test_csrf_protection_invalid_token(
@@ -230,7 +269,8 @@ class TestAuthenticationEndpoints:
         session_id = "test-session-id"
         csrf_token = "invalid-csrf-token"
 
-        mock_session_manager.validate_csrf_token.return_value = False
+        calls = []
+        mock_session_manager.validate_csrf_token.side_effect = _recorder(calls, False)
 
         # Simulate CSRF validation
         is_valid = await mock_session_manager.validate_csrf_token(
@@ -238,9 +278,7 @@ class TestAuthenticationEndpoints:
         )
 
         assert is_valid is False
-        mock_session_manager.validate_csrf_token.assert_called_once_with(
-            session_id, csrf_token
-        )
+        assert calls == [((session_id, csrf_token), {})]
 
     @pytest.mark.asyncio
     async def test_csrf_protection_missing_token(
@@ -257,21 +295,22 @@ class TestAuthenticationEndpoints:
 
     @pytest.mark.asyncio
     async def test_login_with_rate_limiting_allowed(
-        self, mock_session_manager, admin_user_data, mock_session_request
+        self,
+        mock_session_manager,
+        admin_user_data,
+        admin_user_data_with_id,
+        mock_session_request,
     ):
         """Test login endpoint with rate limiting - allowed attempt."""
         username = admin_user_data["username"]
         password = "password123"
         ip_address = "127.0.0.1"
 
-        # Add id to admin_user_data for testing
-        admin_user_data_with_id = {**admin_user_data, "id": 1}
-
         # Mock rate limiting to allow the attempt
         mock_session_manager.track_login_attempt.return_value = (True, 4)
         mock_session_manager.create_session.return_value = (
-            "test-session-id",
-            "test-csrf-token",
+            sentinel.session_id,
+            sentinel.csrf_token,
         )
 
         with patch(
@@ -304,8 +343,8 @@ class TestAuthenticationEndpoints:
                 request=mock_session_request, user_id=user["id"]
             )
 
-            assert session_id == "test-session-id"
-            assert csrf_token == "test-csrf-token"
+            assert session_id is sentinel.session_id
+            assert csrf_token is sentinel.csrf_token
 
     @pytest.mark.asyncio
     async def test_login_with_rate_limiting_blocked(
@@ -338,12 +377,13 @@ class TestAuthenticationEndpoints:
         session_id = "expired-session-id"
 
         # Mock expired session
-        mock_session_manager.validate_session.return_value = None
+        calls = []
+        mock_session_manager.validate_session.side_effect = _recorder(calls)
 
         session_data = await mock_session_manager.validate_session(session_id)
 
         assert session_data is None
-        mock_session_manager.validate_session.assert_called_once_with(session_id)
+        assert calls == [((session_id,), {})]
 
     @pytest.mark.asyncio
     async def test_session_cleanup(self, mock_session_manager):
@@ -358,11 +398,9 @@ class TestAuthenticationEndpoints:
     @pytest.mark.asyncio
     async def test_session_cookie_handling(self, mock_session_manager):
         """Test session cookie setting and clearing."""
-        from fastapi import Response
-
-        response = MagicMock(spec=Response)
-        session_id = "test-session-id"
-        csrf_token = "test-csrf-token"
+        response = object()
+        session_id = sentinel.session_id
+        csrf_token = sentinel.csrf_token
 
         # Test setting cookies
         mock_session_manager.set_session_cookies(
@@ -387,42 +425,6 @@ class TestAuthenticationEndpoints:
 class TestSessionDependencies:
     """Test session-related dependencies and middleware."""
 
-    async def mock_get_session_from_cookie(self, request, session_manager):
-        """Mock implementation of getting session from cookie."""
-        session_id = request.cookies.get("session_id")
-        if not session_id:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Not authenticated",
-            )
-
-        session_data = await session_manager.validate_session(session_id)
-        if not session_data:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid or expired session",
-            )
-
-        return session_data
-
-    async def mock_verify_csrf_token(self, request, session_data, session_manager):
-        """Mock implementation of CSRF token verification."""
-        if request.method in ("GET", "HEAD", "OPTIONS"):
-            return
-
-        if not session_data:
-            return
-
-        token = request.headers.get("X-CSRF-Token")
-        if not token:
-            raise CSRFException("CSRF token missing")
-
-        is_valid = await session_manager.validate_csrf_token(
-            session_data.session_id, token
-        )
-        if not is_valid:
-            raise CSRFException("Invalid CSRF token")
-
     @pytest.mark.asyncio
     async def test_get_session_from_cookie_success(
         self, mock_session_manager, mock_session_data
@@ -431,14 +433,15 @@ class TestSessionDependencies:
         mock_request = MagicMock(spec=Request)
         mock_request.cookies = {"session_id": "test-session-id"}
 
-        mock_session_manager.validate_session.return_value = mock_session_data
-
-        result = await self.mock_get_session_from_cookie(
-            mock_request, mock_session_manager
+        calls = []
+        mock_session_manager.validate_session.side_effect = _recorder(
+            calls, mock_session_data
         )
 
+        result = await _get_session_from_cookie(mock_request, mock_session_manager)
+
         assert result == mock_session_data
-        mock_session_manager.validate_session.assert_called_once_with("test-session-id")
+        assert calls == [(("test-session-id",), {})]
 
     @pytest.mark.asyncio
     async def test_get_session_from_cookie_no_cookie(self, mock_session_manager):
@@ -447,9 +450,9 @@ class TestSessionDependencies:
         mock_request.cookies = {}
 
         with pytest.raises(HTTPException) as exc_info:
-            await self.mock_get_session_from_cookie(mock_request, mock_session_manager)
+            await _get_session_from_cookie(mock_request, mock_session_manager)
 
-        assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+        assert exc_info.value.status_code == _STATUS_401
         assert "Not authenticated" in exc_info.value.detail
 
     @pytest.mark.asyncio
@@ -458,16 +461,15 @@ class TestSessionDependencies:
         mock_request = MagicMock(spec=Request)
         mock_request.cookies = {"session_id": "invalid-session-id"}
 
-        mock_session_manager.validate_session.return_value = None
+        calls = []
+        mock_session_manager.validate_session.side_effect = _recorder(calls)
 
         with pytest.raises(HTTPException) as exc_info:
-            await self.mock_get_session_from_cookie(mock_request, mock_session_manager)
+            await _get_session_from_cookie(mock_request, mock_session_manager)
 
-        assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+        assert exc_info.value.status_code == _STATUS_401
         assert "Invalid or expired session" in exc_info.value.detail
-        mock_session_manager.validate_session.assert_called_once_with(
-            "invalid-session-id"
-        )
+        assert calls == [(("invalid-session-id",), {})]
 
     @pytest.mark.asyncio
     async def test_verify_csrf_token_valid(
@@ -478,18 +480,17 @@ class TestSessionDependencies:
         mock_request.method = "POST"
         mock_request.headers = {"X-CSRF-Token": "test-csrf-token"}
 
-        mock_session_manager.validate_csrf_token.return_value = True
+        calls = []
+        mock_session_manager.validate_csrf_token.side_effect = _recorder(calls, True)
 
         # Should not raise any exception
-        await self.mock_verify_csrf_token(
+        await _verify_csrf_token(
             request=mock_request,
             session_data=mock_session_data,
             session_manager=mock_session_manager,
         )
 
-        mock_session_manager.validate_csrf_token.assert_called_once_with(
-            "test-session-id", "test-csrf-token"
-        )
+        assert calls == [(("test-session-id", "test-csrf-token"), {})]
 
     @pytest.mark.asyncio
     async def test_verify_csrf_token_missing(
@@ -501,7 +502,7 @@ class TestSessionDependencies:
         mock_request.headers = {}
 
         with pytest.raises(CSRFException) as exc_info:
-            await self.mock_verify_csrf_token(
+            await _verify_csrf_token(
                 request=mock_request,
                 session_data=mock_session_data,
                 session_manager=mock_session_manager,
@@ -518,19 +519,18 @@ class TestSessionDependencies:
         mock_request.method = "POST"
         mock_request.headers = {"X-CSRF-Token": "invalid-csrf-token"}
 
-        mock_session_manager.validate_csrf_token.return_value = False
+        calls = []
+        mock_session_manager.validate_csrf_token.side_effect = _recorder(calls, False)
 
         with pytest.raises(CSRFException) as exc_info:
-            await self.mock_verify_csrf_token(
+            await _verify_csrf_token(
                 request=mock_request,
                 session_data=mock_session_data,
                 session_manager=mock_session_manager,
             )
 
         assert "Invalid CSRF token" in str(exc_info.value.detail)
-        mock_session_manager.validate_csrf_token.assert_called_once_with(
-            "test-session-id", "invalid-csrf-token"
-        )
+        assert calls == [(("test-session-id", "invalid-csrf-token"), {})]
 
     @pytest.mark.asyncio
     async def test_verify_csrf_token_get_method_skip(
@@ -542,7 +542,7 @@ class TestSessionDependencies:
         mock_request.headers = {}
 
         # Should not raise any exception for GET request
-        await self.mock_verify_csrf_token(
+        await _verify_csrf_token(
             request=mock_request,
             session_data=mock_session_data,
             session_manager=mock_session_manager,
@@ -559,7 +559,7 @@ class TestSessionDependencies:
         mock_request.headers = {"X-CSRF-Token": "test-csrf-token"}
 
         # Should not raise any exception when session_data is None
-        await self.mock_verify_csrf_token(
+        await _verify_csrf_token(
             request=mock_request,
             session_data=None,
             session_manager=mock_session_manager,
@@ -1,10 +1,14 @@
+import asyncio
+import functools
 import uuid
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Generator, Mapping
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Type
+from types import MappingProxyType, SimpleNamespace
+from typing import TYPE_CHECKING, Any, Optional, Type, Union
 from unittest.mock import AsyncMock, MagicMock, Mock
 
+import bcrypt
 import pytest
 import pytest_asyncio
 from fastapi import Request, Response
@@ -19,26 +23,44 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    event,
     make_url,
 )
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import DeclarativeBase, relationship, sessionmaker
+from sqlalchemy.engine import URL, Dialect
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase, relationship
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable
 from sqlalchemy.sql import func
-from testcontainers.core.docker_client import DockerClient
-from testcontainers.mysql import MySqlContainer
-from testcontainers.postgres import PostgresContainer
-
-from crudadmin.admin_interface.crud_admin import CRUDAdmin
-from crudadmin.admin_user.service import AdminUserService
-from crudadmin.core.db import DatabaseConfig
-from crudadmin.event.models import create_admin_audit_log, create_admin_event_log
-from crudadmin.event.service import EventService
-from crudadmin.session.manager import SessionManager
-from crudadmin.session.schemas import SessionData
-from crudadmin.session.storage import get_session_storage
+
+# testcontainers and crudadmin are imported inside the fixtures that use them,
+# so running a subset of tests only loads what it needs.
+if TYPE_CHECKING:
+    from testcontainers.mysql import MySqlContainer
+    from testcontainers.postgres import PostgresContainer
+
+    from crudadmin.admin_interface.crud_admin import CRUDAdmin
+    from crudadmin.admin_user.service import AdminUserService
+    from crudadmin.core.db import DatabaseConfig
+    from crudadmin.event.service import EventService
+    from crudadmin.session.manager import SessionManager
 
 UTC = timezone.utc
 
+TEMPLATE_DATABASE = "template_crud"
+DIALECT_MARKS = {"postgresql": "postgres", "mysql": "mysql"}
+# Room for the compiled statements of the whole suite; SQLAlchemy's default is 500.
+QUERY_CACHE_SIZE = 1200
+_postgres_templates: set[str] = set()
+_CREATE_SQL: dict[str, tuple[str, ...]] = {}
+_SHARED_ENGINES: dict[str, AsyncEngine] = {}
+_initialized_engines: set[AsyncEngine] = set()
+
 
 class Base(DeclarativeBase):
     pass
@@ -200,7 +222,12 @@ class EmailQueryConfigUpdateInternal(EmailQueryConfigUpdate):
     id: uuid.UUID
 
 
+@functools.lru_cache(maxsize=1)
 def is_docker_running() -> bool:
+    # Imported lazily: the Docker SDK is slow to import and SQLite-only runs
+    # never need it.
+    from testcontainers.core.docker_client import DockerClient
+
     try:
         DockerClient()
         return True
@@ -208,69 +235,252 @@ def is_docker_running() -> bool:
         return False
 
 
+def _create_statements(dialect: Dialect) -> tuple[str, ...]:
+    """Return the compiled ``CREATE`` DDL for ``Base.metadata``, cached per dialect."""
+    statements = _CREATE_SQL.get(dialect.name)
+    if statements is None:
+        ddl: list[str] = []
+        for table in Base.metadata.sorted_tables:
+            ddl.append(str(CreateTable(table).compile(dialect=dialect)))
+            ddl.extend(
+                str(CreateIndex(index).compile(dialect=dialect))
+                for index in table.indexes
+            )
+        statements = _CREATE_SQL[dialect.name] = tuple(ddl)
+    return statements
+
+
+def _shared_sqlite_engine(name: str, url: Union[str, URL]) -> AsyncEngine:
+    """Return the process-wide SQLite engine registered under ``name``.
+
+    The engine holds a single connection (``StaticPool``) with SQLite's own
+    transaction handling disabled, so SQLAlchemy can emit ``BEGIN`` itself and
+    savepoints and transactional DDL behave as on other backends.
+    """
+    engine = _SHARED_ENGINES.get(name)
+    if engine is None:
+        engine = create_async_engine(
+            url,
+            echo=False,
+            future=True,
+            query_cache_size=QUERY_CACHE_SIZE,
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine.sync_engine, "begin")
+        def _emit_begin(conn):
+            conn.exec_driver_sql("BEGIN")
+
+        _SHARED_ENGINES[name] = engine
+    return engine
+
+
+@asynccontextmanager
+async def _isolated_session(async_engine: AsyncEngine) -> AsyncGenerator[AsyncSession]:
+    """Yield a session inside an outer transaction that is rolled back afterwards.
+
+    Commits issued by the test only release a savepoint, so every row written
+    during the test disappears when it finishes.
+    """
+    async with async_engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            autoflush=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
+
+
 @asynccontextmanager
-async def _async_session(url: str) -> AsyncGenerator[AsyncSession]:
-    async_engine = create_async_engine(url, echo=False, future=True)
+async def _async_session(url: Union[str, URL]) -> AsyncGenerator[AsyncSession]:
+    if make_url(url).get_backend_name() == "sqlite":
+        async_engine = _shared_sqlite_engine("app", url)
+        if async_engine not in _initialized_engines:
+            async with async_engine.begin() as conn:
+                for statement in _create_statements(async_engine.dialect):
+                    await conn.exec_driver_sql(statement)
+            _initialized_engines.add(async_engine)
+
+        async with _isolated_session(async_engine) as s:
+            yield s
+        return
+
+    async_engine = create_async_engine(
+        url, echo=False, future=True, query_cache_size=QUERY_CACHE_SIZE
+    )
 
-    session = sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    session = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
 
     async with session() as s:
         async with async_engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+            for statement in _create_statements(async_engine.dialect):
+                await conn.exec_driver_sql(statement)
 
         yield s
 
+    # Recreating the database is a single statement pair, unlike drop_all which
+    # reflects and drops every table one by one.
+    database = make_url(url).database
     async with async_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+        await conn.exec_driver_sql(f"DROP DATABASE {database}")
+        await conn.exec_driver_sql(f"CREATE DATABASE {database}")
 
     await async_engine.dispose()
 
 
 @asynccontextmanager
-async def _admin_async_session(url: str) -> AsyncGenerator[AsyncSession]:
-    async_engine = create_async_engine(url, echo=False, future=True)
+async def _postgres_async_session(server_url: URL) -> AsyncGenerator[AsyncSession]:
+    """Yield a session bound to a throwaway database cloned from a template."""
+    admin_engine = create_async_engine(
+        server_url.set(database="postgres"), isolation_level="AUTOCOMMIT"
+    )
+    try:
+        server_key = server_url.render_as_string(hide_password=False)
+        if server_key not in _postgres_templates:
+            async with admin_engine.connect() as conn:
+                await conn.exec_driver_sql(f"CREATE DATABASE {TEMPLATE_DATABASE}")
+            template_engine = create_async_engine(
+                server_url.set(database=TEMPLATE_DATABASE)
+            )
+            async with template_engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            await template_engine.dispose()
+            _postgres_templates.add(server_key)
+
+        database = f"test_{uuid.uuid4().hex}"
+        async with admin_engine.connect() as conn:
+            await conn.exec_driver_sql(
+                f"CREATE DATABASE {database} TEMPLATE {TEMPLATE_DATABASE}"
+            )
+
+        async_engine = create_async_engine(
+            server_url.set(database=database),
+            echo=False,
+            future=True,
+            query_cache_size=QUERY_CACHE_SIZE,
+        )
+        session = async_sessionmaker(
+            async_engine, expire_on_commit=False, autoflush=False
+        )
+        try:
+            async with session() as s:
+                yield s
+        finally:
+            await async_engine.dispose()
+            async with admin_engine.connect() as conn:
+                await conn.exec_driver_sql(f"DROP DATABASE {database}")
+    finally:
+        await admin_engine.dispose()
 
-    session = sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
 
-    async with session() as s:
+@asynccontextmanager
+async def _admin_async_session(url: str) -> AsyncGenerator[AsyncSession]:
+    async_engine = _shared_sqlite_engine("admin", url)
+    if async_engine not in _initialized_engines:
         admin_base = create_admin_base()
         async with async_engine.begin() as conn:
             await conn.run_sync(admin_base.metadata.create_all)
+        _initialized_engines.add(async_engine)
 
+    async with _isolated_session(async_engine) as s:
         yield s
 
-    async with async_engine.begin() as conn:
-        await conn.run_sync(admin_base.metadata.drop_all)
 
-    await async_engine.dispose()
+@pytest.fixture(scope="session", autouse=True)
+def _close_session_resources() -> Generator[None]:
+    yield
+
+    async def dispose_all() -> None:
+        for engine in _SHARED_ENGINES.values():
+            await engine.dispose()
+
+    asyncio.run(dispose_all())
+    _SHARED_ENGINES.clear()
+    _initialized_engines.clear()
+
+
+# Session-scoped fixtures are instantiated once per process, so every
+# pytest-xdist worker starts and owns its own database containers.
+@pytest.fixture(scope="session")
+def postgres_container() -> Generator["PostgresContainer"]:
+    if not is_docker_running():
+        pytest.skip("Docker is required, but not running")
+    from testcontainers.postgres import PostgresContainer
+
+    with PostgresContainer(driver="psycopg") as pg:
+        yield pg
+
+
+@pytest.fixture(scope="session")
+def mysql_container() -> Generator["MySqlContainer"]:
+    if not is_docker_running():
+        pytest.skip("Docker is required, but not running")
+    from testcontainers.mysql import MySqlContainer
+
+    with MySqlContainer() as mysql:
+        yield mysql
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize ``async_session`` over the dialects named by the test's marker.
+
+    Each dialect becomes its own test item (``test_x[postgresql]``), so pytest-xdist
+    can schedule slow container-backed cases alongside SQLite ones, and the
+    ``postgres``/``mysql`` markers allow filtering with ``-m``.
+    """
+    if "async_session" not in metafunc.fixturenames:
+        return
+
+    dialect_marker = metafunc.definition.get_closest_marker("dialect")
+    dialects = dialect_marker.args if dialect_marker else ("sqlite",)
+    metafunc.parametrize(
+        "async_session",
+        [
+            pytest.param(
+                dialect,
+                id=dialect,
+                marks=[getattr(pytest.mark, DIALECT_MARKS[dialect])]
+                if dialect in DIALECT_MARKS
+                else [],
+            )
+            for dialect in dialects
+        ],
+        indirect=True,
+    )
 
 
 @pytest_asyncio.fixture(scope="function")
 async def async_session(request: pytest.FixtureRequest) -> AsyncGenerator[AsyncSession]:
-    dialect_marker = request.node.get_closest_marker("dialect")
-    dialect = dialect_marker.args[0] if dialect_marker else "sqlite"
+    dialect = getattr(request, "param", "sqlite")
 
     if dialect == "postgresql":
-        if not is_docker_running():
-            pytest.skip("Docker is required, but not running")
-        with PostgresContainer(driver="psycopg") as pg:
-            async with _async_session(
-                url=pg.get_connection_url(host=pg.get_container_host_ip())
-            ) as session:
-                yield session
+        pg = request.getfixturevalue("postgres_container")
+        async with _postgres_async_session(
+            server_url=make_url(pg.get_connection_url(host=pg.get_container_host_ip()))
+        ) as session:
+            yield session
     elif dialect == "sqlite":
         async with _async_session(url="sqlite+aiosqlite:///:memory:") as session:
             yield session
     elif dialect == "mysql":
-        if not is_docker_running():
-            pytest.skip("Docker is required, but not running")
-        with MySqlContainer() as mysql:
-            async with _async_session(
-                url=make_url(name_or_url=mysql.get_connection_url())._replace(
-                    drivername="mysql+aiomysql"
-                )
-            ) as session:
-                yield session
+        mysql = request.getfixturevalue("mysql_container")
+        async with _async_session(
+            url=make_url(name_or_url=mysql.get_connection_url())._replace(
+                drivername="mysql+aiomysql"
+            )
+        ) as session:
+            yield session
     else:
         raise NotImplementedError(f"Unsupported dialect: {dialect}")
 
@@ -281,208 +491,254 @@ async def admin_async_session() -> AsyncGenerator[AsyncSession]:
         yield session
 
 
-@pytest.fixture(scope="function")
-def test_data() -> list[dict]:
-    return [
-        {"id": 1, "name": "Laptop", "price": 1000, "category_id": 1},
-        {"id": 2, "name": "Mouse", "price": 25, "category_id": 1},
-        {"id": 3, "name": "Book", "price": 15, "category_id": 2},
-        {"id": 4, "name": "Pen", "price": 2, "category_id": 2},
-        {"id": 5, "name": "Monitor", "price": 300, "category_id": 1},
-    ]
-
-
-@pytest.fixture(scope="function")
-def category_data() -> list[dict]:
-    return [
-        {"id": 1, "name": "Electronics"},
-        {"id": 2, "name": "Office"},
-    ]
-
-
-@pytest.fixture(scope="function")
-def user_data() -> list[dict]:
-    return [
-        {"id": 1, "username": "alice", "email": "alice@example.com", "is_active": True},
-        {"id": 2, "username": "bob", "email": "bob@example.com", "is_active": True},
-        {
-            "id": 3,
-            "username": "charlie",
-            "email": "charlie@example.com",
-            "is_active": False,
-        },
-    ]
-
-
-@pytest.fixture(scope="function")
-def admin_user_data() -> dict:
-    return {
+def _frozen_rows(*rows: dict[str, Any]) -> tuple[Mapping[str, Any], ...]:
+    return tuple(MappingProxyType(row) for row in rows)
+
+
+# Read-only seed data; tests that need to modify a row must copy it with dict().
+_TEST_DATA = _frozen_rows(
+    {"id": 1, "name": "Laptop", "price": 1000, "category_id": 1},
+    {"id": 2, "name": "Mouse", "price": 25, "category_id": 1},
+    {"id": 3, "name": "Book", "price": 15, "category_id": 2},
+    {"id": 4, "name": "Pen", "price": 2, "category_id": 2},
+    {"id": 5, "name": "Monitor", "price": 300, "category_id": 1},
+)
+
+_CATEGORY_DATA = _frozen_rows(
+    {"id": 1, "name": "Electronics"},
+    {"id": 2, "name": "Office"},
+)
+
+_USER_DATA = _frozen_rows(
+    {"id": 1, "username": "alice", "email": "alice@example.com", "is_active": True},
+    {"id": 2, "username": "bob", "email": "bob@example.com", "is_active": True},
+    {
+        "id": 3,
+        "username": "charlie",
+        "email": "charlie@example.com",
+        "is_active": False,
+    },
+)
+
+_UUID_TEST_DATA = _frozen_rows(
+    {
+        "id": "93c025d9-5831-413c-9460-edb3a28cc729",
+        "name": "Test Item 1",
+        "description": "First test item with UUID",
+    },
+    {
+        "id": "550e8400-e29b-41d4-a716-446655440000",
+        "name": "Test Item 2",
+        "description": "Second test item with UUID",
+    },
+)
+
+_EMAIL_QUERY_CONFIG_DATA = _frozen_rows(
+    {
+        "id": "93c025d9-5831-413c-9460-edb3a28cc729",
+        "template_id": "template_1",
+        "query_name": "User Query",
+        "query_text": "SELECT * FROM users",
+        "query_type": "select",
+    },
+    {
+        "id": "6ba7b810-9dad-11d1-80b4-00c04fd430c8",
+        "template_id": "template_2",
+        "query_name": "Admin Query",
+        "query_text": "SELECT * FROM admin_users",
+        "query_type": "select",
+    },
+)
+
+_ADMIN_USER_DATA: Mapping[str, Any] = MappingProxyType(
+    {
         "username": "admin",
         "password": "SecurePass123!",
         "is_superuser": True,
     }
+)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def test_data() -> tuple[Mapping[str, Any], ...]:
+    return _TEST_DATA
+
+
+@pytest.fixture(scope="session")
+def category_data() -> tuple[Mapping[str, Any], ...]:
+    return _CATEGORY_DATA
+
+
+@pytest.fixture(scope="session")
+def user_data() -> tuple[Mapping[str, Any], ...]:
+    return _USER_DATA
+
+
+@pytest.fixture(scope="session")
+def admin_user_data() -> Mapping[str, Any]:
+    return _ADMIN_USER_DATA
+
+
+@pytest.fixture(scope="session")
+def models() -> SimpleNamespace:
+    """All test models and schemas, resolved as a single fixture."""
+    return SimpleNamespace(
+        product=ProductModel,
+        product_create=ProductCreate,
+        product_read=ProductRead,
+        product_update=ProductUpdate,
+        category=CategoryModel,
+        category_create=CategoryCreate,
+        category_read=CategoryRead,
+        category_update=CategoryUpdate,
+        user=UserModel,
+        user_create=UserCreate,
+        user_read=UserRead,
+        user_update=UserUpdate,
+        uuid=UUIDModel,
+        uuid_create=UUIDModelCreate,
+        uuid_read=UUIDModelRead,
+        uuid_update=UUIDModelUpdate,
+        uuid_update_internal=UUIDModelUpdateInternal,
+        email_query_config=EmailQueryConfig,
+        email_query_config_create=EmailQueryConfigCreate,
+        email_query_config_read=EmailQueryConfigRead,
+        email_query_config_update=EmailQueryConfigUpdate,
+        email_query_config_update_internal=EmailQueryConfigUpdateInternal,
+    )
+
+
+@pytest.fixture(scope="session")
 def product_model():
     return ProductModel
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def category_model():
     return CategoryModel
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def user_model():
     return UserModel
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def product_create_schema():
     return ProductCreate
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def product_read_schema():
     return ProductRead
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def product_update_schema():
     return ProductUpdate
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def category_create_schema():
     return CategoryCreate
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def category_read_schema():
     return CategoryRead
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def category_update_schema():
     return CategoryUpdate
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def user_create_schema():
     return UserCreate
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def user_read_schema():
     return UserRead
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def user_update_schema():
     return UserUpdate
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def uuid_model():
     return UUIDModel
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def email_query_config_model():
     return EmailQueryConfig
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def uuid_model_create_schema():
     return UUIDModelCreate
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def uuid_model_read_schema():
     return UUIDModelRead
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def uuid_model_update_schema():
     return UUIDModelUpdate
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def uuid_model_update_internal_schema():
     return UUIDModelUpdateInternal
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def email_query_config_create_schema():
     return EmailQueryConfigCreate
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def email_query_config_read_schema():
     return EmailQueryConfigRead
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def email_query_config_update_schema():
     return EmailQueryConfigUpdate
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def email_query_config_update_internal_schema():
     return EmailQueryConfigUpdateInternal
 
 
-@pytest.fixture(scope="function")
-def uuid_test_data() -> list[dict]:
-    return [
-        {
-            "id": "93c025d9-5831-413c-9460-edb3a28cc729",
-            "name": "Test Item 1",
-            "description": "First test item with UUID",
-        },
-        {
-            "id": "550e8400-e29b-41d4-a716-446655440000",
-            "name": "Test Item 2",
-            "description": "Second test item with UUID",
-        },
-    ]
-
-
-@pytest.fixture(scope="function")
-def email_query_config_data() -> list[dict]:
-    return [
-        {
-            "id": "93c025d9-5831-413c-9460-edb3a28cc729",
-            "template_id": "template_1",
-            "query_name": "User Query",
-            "query_text": "SELECT * FROM users",
-            "query_type": "select",
-        },
-        {
-            "id": "6ba7b810-9dad-11d1-80b4-00c04fd430c8",
-            "template_id": "template_2",
-            "query_name": "Admin Query",
-            "query_text": "SELECT * FROM admin_users",
-            "query_type": "select",
-        },
-    ]
+@pytest.fixture(scope="session")
+def uuid_test_data() -> tuple[Mapping[str, Any], ...]:
+    return _UUID_TEST_DATA
+
+
+@pytest.fixture(scope="session")
+def email_query_config_data() -> tuple[Mapping[str, Any], ...]:
+    return _EMAIL_QUERY_CONFIG_DATA
 
 
 @pytest_asyncio.fixture(scope="function")
-async def db_config(admin_async_session) -> AsyncGenerator[DatabaseConfig, None]:
+async def db_config(admin_async_session) -> AsyncGenerator["DatabaseConfig", None]:
     """Create a DatabaseConfig instance for testing."""
-    admin_base = create_admin_base()
-
-    admin_event_log = create_admin_event_log(admin_base)
-    admin_audit_log = create_admin_audit_log(admin_base)
+    from crudadmin.core.db import DatabaseConfig
 
     config = DatabaseConfig(
-        base=admin_base,
+        base=create_admin_base(),
         session=admin_async_session,
         admin_db_url="sqlite+aiosqlite:///:memory:",
-        admin_event_log=admin_event_log,
-        admin_audit_log=admin_audit_log,
+        **map_admin_models(create_admin_base()),
+        **map_event_models(create_admin_base()),
     )
 
     await config.initialize_admin_db()
@@ -493,14 +749,20 @@ async def db_config(admin_async_session) -> AsyncGenerator[DatabaseConfig, None]
 
 
 @pytest_asyncio.fixture(scope="function")
-async def admin_user_service(db_config) -> AdminUserService:
+async def admin_user_service(db_config) -> "AdminUserService":
     """Create an AdminUserService instance for testing."""
+    from crudadmin.admin_user.service import AdminUserService
+
     return AdminUserService(db_config=db_config)
 
 
 @pytest_asyncio.fixture(scope="function")
-async def session_manager(db_config) -> SessionManager:
+async def session_manager(db_config) -> "SessionManager":
     """Create a SessionManager instance for testing."""
+    from crudadmin.session.manager import SessionManager
+    from crudadmin.session.schemas import SessionData
+    from crudadmin.session.storage import get_session_storage
+
     # Use memory backend for testing
     storage = get_session_storage(
         backend="memory",
@@ -517,24 +779,29 @@ async def session_manager(db_config) -> SessionManager:
 
 
 @pytest_asyncio.fixture(scope="function")
-async def event_service(db_config) -> EventService:
+async def event_service(db_config) -> "EventService":
     """Create an EventService instance for testing."""
+    from crudadmin.event.service import EventService
+
     return EventService(db_config=db_config)
 
 
 @pytest_asyncio.fixture(scope="function")
-async def crud_admin(async_session) -> CRUDAdmin:
+async def crud_admin(async_session) -> AsyncGenerator["CRUDAdmin"]:
     """Create a CRUDAdmin instance for testing."""
+    from crudadmin.admin_interface.crud_admin import CRUDAdmin
+
     admin = CRUDAdmin(
         session=async_session,
         admin_db_url="sqlite+aiosqlite:///:memory:",
         SECRET_KEY="test-secret-key-for-testing-only-min-32-chars",
         setup_on_initialization=False,
     )
-
     await admin.initialize()
 
-    return admin
+    yield admin
+
+    await admin.db_config.admin_engine.dispose()
 
 
 @pytest.fixture
@@ -543,6 +810,21 @@ def test_client(crud_admin):
     return TestClient(crud_admin.app)
 
 
+# bcrypt's minimum cost factor; every hash is still a valid "$2b$" hash.
+BCRYPT_TEST_ROUNDS = 4
+
+
+@pytest.fixture
+def fast_bcrypt(monkeypatch):
+    """Generate minimum-cost salts so hashing in a test stays cheap."""
+    real_gensalt = bcrypt.gensalt
+
+    def gensalt(rounds: int = BCRYPT_TEST_ROUNDS, prefix: bytes = b"2b") -> bytes:
+        return real_gensalt(rounds=BCRYPT_TEST_ROUNDS, prefix=prefix)
+
+    monkeypatch.setattr(bcrypt, "gensalt", gensalt)
+
+
 @pytest.fixture
 def mock_request():
     """Create a mock request object for testing."""
@@ -552,8 +834,9 @@ def mock_request():
     return request
 
 
+@functools.lru_cache(maxsize=1)
 def create_admin_base() -> Type[DeclarativeBase]:
-    """Create a unique AdminBase class for each test to avoid table conflicts."""
+    """Create the AdminBase shared by the admin fixtures, once per test run."""
 
     class AdminBase(DeclarativeBase):
         pass
@@ -561,6 +844,33 @@ def create_admin_base() -> Type[DeclarativeBase]:
     return AdminBase
 
 
+@functools.cache
+def map_admin_models(admin_base: Type[DeclarativeBase]) -> dict[str, Any]:
+    """Map the admin user and session tables onto ``admin_base``, once per base.
+
+    The result is DatabaseConfig keyword arguments, so configs sharing a base
+    do not map the tables a second time.
+    """
+    from crudadmin.admin_user.models import create_admin_user
+    from crudadmin.session.models import create_admin_session_model
+
+    return {
+        "admin_user": create_admin_user(admin_base),
+        "admin_session": create_admin_session_model(admin_base),
+    }
+
+
+@functools.cache
+def map_event_models(admin_base: Type[DeclarativeBase]) -> dict[str, Any]:
+    """Map the event and audit log tables onto ``admin_base``, once per base."""
+    from crudadmin.event.models import create_admin_audit_log, create_admin_event_log
+
+    return {
+        "admin_event_log": create_admin_event_log(admin_base),
+        "admin_audit_log": create_admin_audit_log(admin_base),
+    }
+
+
 # Session-specific fixtures
 @pytest.fixture
 def mock_session_storage():
@@ -590,6 +900,8 @@ def mock_csrf_storage():
 @pytest.fixture
 def mock_session_manager():
     """Create a mock session manager."""
+    from crudadmin.session.manager import SessionManager
+
     session_manager = MagicMock(spec=SessionManager)
     session_manager.create_session = AsyncMock()
     session_manager.validate_session = AsyncMock()
@@ -604,10 +916,16 @@ def mock_session_manager():
     return session_manager
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_session_data():
-    """Create mock session data for testing."""
-    return SessionData(
+    """Create mock session data for testing.
+
+    Built without validation and shared read-only; tests that need to modify
+    session data should take a ``model_copy()``.
+    """
+    from crudadmin.session.schemas import SessionData
+
+    return SessionData.model_construct(
         session_id="test-session-id",
         user_id=1,
         is_active=True,
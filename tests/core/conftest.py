@@ -0,0 +1,121 @@
+import asyncio
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+import pytest
+from sqlalchemy.orm import DeclarativeBase
+
+from crudadmin.core.db import DatabaseConfig
+from tests.conftest import BCRYPT_TEST_ROUNDS, map_admin_models
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is optional
+    uvloop = None
+
+# Passwords the auth tests hash; bcrypt_hash_cache computes these up front.
+TEST_PASSWORDS = (
+    "test",
+    "test_password",
+    "test_password_123",
+    "correct_password",
+    "tëst_pàsswörd_🔐",
+    "tëst_pàsswörd_123_🔐",
+    "!@#$%^&*()_+-=[]{}|;':\",./<>?",
+)
+
+
+def _hash_password(password: str) -> str:
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(BCRYPT_TEST_ROUNDS)).decode()
+
+
+if uvloop is not None:
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run the async core tests on uvloop when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(autouse=True)
+def _fast_bcrypt(fast_bcrypt):
+    """Apply fast_bcrypt to every core test."""
+
+
+@pytest.fixture(scope="session")
+def bcrypt_hash_cache():
+    """Return a lookup that hashes each distinct password once per test run.
+
+    The known test passwords are hashed in parallel up front; bcrypt releases
+    the GIL while hashing, so a thread pool spreads them across cores.
+    """
+    with ThreadPoolExecutor() as executor:
+        cache = dict(zip(TEST_PASSWORDS, executor.map(_hash_password, TEST_PASSWORDS)))
+
+    def get_hash(password: str) -> str:
+        if password not in cache:
+            cache[password] = _hash_password(password)
+        return cache[password]
+
+    return get_hash
+
+
+@pytest.fixture
+def fake_bcrypt_checkpw(monkeypatch):
+    """Swap bcrypt.checkpw for a plain byte comparison in control-flow tests."""
+
+    def checkpw(password: bytes, hashed_password: bytes) -> bool:
+        return (
+            isinstance(password, bytes)
+            and isinstance(hashed_password, bytes)
+            and bool(hashed_password)
+            and password == hashed_password
+        )
+
+    monkeypatch.setattr(bcrypt, "checkpw", checkpw)
+
+
+@pytest.fixture(scope="session")
+def admin_base() -> type[DeclarativeBase]:
+    """One admin declarative base for the run, mapped once below.
+
+    Each DatabaseConfig built on it gets its own database, so the shared
+    metadata never collides; pass admin_user_cls/admin_session_cls along so
+    DatabaseConfig does not map the admin tables a second time.
+    """
+
+    class AdminBase(DeclarativeBase):
+        pass
+
+    return AdminBase
+
+
+@pytest.fixture(scope="session")
+def admin_user_cls(admin_base) -> type[DeclarativeBase]:
+    return map_admin_models(admin_base)["admin_user"]
+
+
+@pytest.fixture(scope="session")
+def admin_session_cls(admin_base) -> type[DeclarativeBase]:
+    return map_admin_models(admin_base)["admin_session"]
+
+
+@pytest.fixture(scope="module")
+def shared_admin_config(
+    admin_base, admin_user_cls, admin_session_cls
+) -> Generator[DatabaseConfig]:
+    """One in-memory admin DatabaseConfig shared by the tests of a module.
+
+    Only the admin database is used, so no application session is attached.
+    Tests that create tables drop them again before returning.
+    """
+    config = DatabaseConfig(
+        base=admin_base,
+        session=None,  # type: ignore[arg-type]
+        admin_db_url="sqlite+aiosqlite:///:memory:",
+        admin_user=admin_user_cls,
+        admin_session=admin_session_cls,
+    )
+    yield config
+    asyncio.run(config.admin_engine.dispose())
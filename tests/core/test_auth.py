@@ -1,7 +1,7 @@
 import logging
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
-import bcrypt
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -13,75 +13,72 @@ from crudadmin.core.auth import (
 )
 
 
+@pytest.fixture
+def mock_db():
+    return AsyncMock(spec=AsyncSession)
+
+
+@pytest.fixture
+def mock_crud_users():
+    return AsyncMock()
+
+
 class TestVerifyPassword:
     """Test cases for verify_password function."""
 
-    @pytest.mark.asyncio
-    async def test_verify_password_valid_password(self):
+    async def test_verify_password_valid_password(self, bcrypt_hash_cache):
         """Test password verification with valid password."""
         plain_password = "test_password_123"
-        hashed_password = bcrypt.hashpw(
-            plain_password.encode(), bcrypt.gensalt()
-        ).decode()
+        hashed_password = bcrypt_hash_cache(plain_password)
 
         result = await verify_password(plain_password, hashed_password)
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_verify_password_invalid_password(self):
+    async def test_verify_password_invalid_password(self, bcrypt_hash_cache):
         """Test password verification with invalid password."""
         plain_password = "test_password_123"
         wrong_password = "wrong_password"
-        hashed_password = bcrypt.hashpw(
-            plain_password.encode(), bcrypt.gensalt()
-        ).decode()
+        hashed_password = bcrypt_hash_cache(plain_password)
 
         result = await verify_password(wrong_password, hashed_password)
         assert result is False
 
-    @pytest.mark.asyncio
-    async def test_verify_password_empty_plain_password(self):
+    @pytest.mark.usefixtures("fake_bcrypt_checkpw")
+    async def test_verify_password_empty_plain_password(self, bcrypt_hash_cache):
         """Test password verification with empty plain password."""
-        hashed_password = bcrypt.hashpw(b"test", bcrypt.gensalt()).decode()
+        hashed_password = bcrypt_hash_cache("test")
 
         result = await verify_password("", hashed_password)
         assert result is False
 
-    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("fake_bcrypt_checkpw")
     async def test_verify_password_empty_hashed_password(self):
         """Test password verification with empty hashed password."""
         result = await verify_password("test_password", "")
         assert result is False
 
-    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("fake_bcrypt_checkpw")
     async def test_verify_password_invalid_hash_format(self):
         """Test password verification with invalid hash format."""
         result = await verify_password("test_password", "invalid_hash")
         assert result is False
 
-    @pytest.mark.asyncio
-    async def test_verify_password_unicode_characters(self):
+    async def test_verify_password_unicode_characters(self, bcrypt_hash_cache):
         """Test password verification with unicode characters."""
         plain_password = "tëst_pàsswörd_123_🔐"
-        hashed_password = bcrypt.hashpw(
-            plain_password.encode(), bcrypt.gensalt()
-        ).decode()
+        hashed_password = bcrypt_hash_cache(plain_password)
 
         result = await verify_password(plain_password, hashed_password)
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_verify_password_special_characters(self):
+    async def test_verify_password_special_characters(self, bcrypt_hash_cache):
         """Test password verification with special characters."""
         plain_password = "!@#$%^&*()_+-=[]{}|;':\",./<>?"
-        hashed_password = bcrypt.hashpw(
-            plain_password.encode(), bcrypt.gensalt()
-        ).decode()
+        hashed_password = bcrypt_hash_cache(plain_password)
 
         result = await verify_password(plain_password, hashed_password)
         assert result is True
 
-    @pytest.mark.asyncio
     async def test_verify_password_exception_handling(self):
         """Test password verification exception handling."""
         with patch("bcrypt.checkpw") as mock_checkpw:
@@ -90,7 +87,6 @@ class TestVerifyPassword:
             result = await verify_password("test", "test_hash")
             assert result is False
 
-    @pytest.mark.asyncio
     async def test_verify_password_logging_on_error(self, caplog):
         """Test that errors are logged when password verification fails."""
         with patch("bcrypt.checkpw") as mock_checkpw:
@@ -107,9 +103,18 @@ class TestVerifyPassword:
 class TestGetPasswordHash:
     """Test cases for get_password_hash function."""
 
-    def test_get_password_hash_valid_password(self):
-        """Test password hashing with valid password."""
-        password = "test_password_123"
+    @pytest.mark.parametrize(
+        "password",
+        [
+            "test_password_123",
+            "",
+            "tëst_pàsswörd_123_🔐",
+            "!@#$%^&*()_+-=[]{}|;':\",./<>?",
+        ],
+        ids=["valid", "empty", "unicode", "special_characters"],
+    )
+    def test_get_password_hash(self, password):
+        """Test password hashing produces a bcrypt hash for varied inputs."""
         hashed = get_password_hash(password)
 
         assert isinstance(hashed, str)
@@ -117,32 +122,6 @@ class TestGetPasswordHash:
         assert hashed != password
         assert hashed.startswith("$2b$")
 
-    def test_get_password_hash_empty_password(self):
-        """Test password hashing with empty password."""
-        hashed = get_password_hash("")
-
-        assert isinstance(hashed, str)
-        assert len(hashed) > 0
-        assert hashed.startswith("$2b$")
-
-    def test_get_password_hash_unicode_characters(self):
-        """Test password hashing with unicode characters."""
-        password = "tëst_pàsswörd_123_🔐"
-        hashed = get_password_hash(password)
-
-        assert isinstance(hashed, str)
-        assert len(hashed) > 0
-        assert hashed.startswith("$2b$")
-
-    def test_get_password_hash_special_characters(self):
-        """Test password hashing with special characters."""
-        password = "!@#$%^&*()_+-=[]{}|;':\",./<>?"
-        hashed = get_password_hash(password)
-
-        assert isinstance(hashed, str)
-        assert len(hashed) > 0
-        assert hashed.startswith("$2b$")
-
     def test_get_password_hash_consistency(self):
         """Test that same password produces different hashes due to salt."""
         password = "test_password_123"
@@ -323,106 +302,56 @@ class TestConvertUserToDict:
 class TestAuthenticateUserByCredentials:
     """Test cases for authenticate_user_by_credentials function."""
 
-    @pytest.mark.asyncio
-    async def test_authenticate_user_by_credentials_email_success(self):
-        """Test successful authentication with email."""
-        email = "test@example.com"
-        password = "test_password"
-        hashed_password = get_password_hash(password)
-
-        mock_user = {
+    @pytest.mark.parametrize(
+        "identifier, password, key, as_object",
+        [
+            ("test@example.com", "test_password", "email", False),
+            ("testuser", "test_password", "username", False),
+            ("tëstüsér", "tëst_pàsswörd_🔐", "username", False),
+            ("testuser", "test_password", "username", True),
+        ],
+        ids=["email", "username", "unicode", "model_object"],
+    )
+    async def test_authenticate_user_by_credentials_success(
+        self,
+        mock_db,
+        mock_crud_users,
+        bcrypt_hash_cache,
+        identifier,
+        password,
+        key,
+        as_object,
+    ):
+        """Test successful authentication by email, username or model object."""
+        user = {
             "id": 1,
             "username": "testuser",
-            "email": email,
-            "hashed_password": hashed_password,
-            "is_active": True,
-        }
-
-        mock_db = AsyncMock(spec=AsyncSession)
-        mock_crud_users = AsyncMock()
-        mock_crud_users.get.return_value = mock_user
-
-        result = await authenticate_user_by_credentials(
-            username_or_email=email,
-            password=password,
-            db=mock_db,
-            crud_users=mock_crud_users,
-        )
-
-        assert result is not None
-        assert result["id"] == 1
-        assert result["username"] == "testuser"
-        assert result["email"] == email
-        mock_crud_users.get.assert_called_once_with(db=mock_db, email=email)
-
-    @pytest.mark.asyncio
-    async def test_authenticate_user_by_credentials_username_success(self):
-        """Test successful authentication with username."""
-        username = "testuser"
-        password = "test_password"
-        hashed_password = get_password_hash(password)
-
-        mock_user = {
-            "id": 1,
-            "username": username,
             "email": "test@example.com",
-            "hashed_password": hashed_password,
+            key: identifier,
+            "hashed_password": bcrypt_hash_cache(password),
             "is_active": True,
         }
-
-        mock_db = AsyncMock(spec=AsyncSession)
-        mock_crud_users = AsyncMock()
-        mock_crud_users.get.return_value = mock_user
-
-        result = await authenticate_user_by_credentials(
-            username_or_email=username,
-            password=password,
-            db=mock_db,
-            crud_users=mock_crud_users,
+        mock_crud_users.get.return_value = (
+            SimpleNamespace(**user) if as_object else user
         )
 
-        assert result is not None
-        assert result["id"] == 1
-        assert result["username"] == username
-        mock_crud_users.get.assert_called_once_with(db=mock_db, username=username)
-
-    @pytest.mark.asyncio
-    async def test_authenticate_user_by_credentials_model_object(self):
-        """Test authentication with model object returned from CRUD."""
-
-        class MockUser:
-            def __init__(self):
-                self.id = 1
-                self.username = "testuser"
-                self.email = "test@example.com"
-                self.hashed_password = get_password_hash("test_password")
-                self.is_active = True
-                self.is_superuser = False
-                self.created_at = "2023-01-01"
-                self.updated_at = "2023-01-01"
-
-        mock_user_obj = MockUser()
-        mock_db = AsyncMock(spec=AsyncSession)
-        mock_crud_users = AsyncMock()
-        mock_crud_users.get.return_value = mock_user_obj
-
         result = await authenticate_user_by_credentials(
-            username_or_email="testuser",
-            password="test_password",
+            username_or_email=identifier,
+            password=password,
             db=mock_db,
             crud_users=mock_crud_users,
         )
 
         assert result is not None
         assert result["id"] == 1
-        assert result["username"] == "testuser"
-        assert result["email"] == "test@example.com"
+        assert result["username"] == user["username"]
+        assert result["email"] == user["email"]
+        mock_crud_users.get.assert_called_once_with(db=mock_db, **{key: identifier})
 
-    @pytest.mark.asyncio
-    async def test_authenticate_user_by_credentials_user_not_found(self):
+    async def test_authenticate_user_by_credentials_user_not_found(
+        self, mock_db, mock_crud_users
+    ):
         """Test authentication when user is not found."""
-        mock_db = AsyncMock(spec=AsyncSession)
-        mock_crud_users = AsyncMock()
         mock_crud_users.get.return_value = None
 
         result = await authenticate_user_by_credentials(
@@ -434,19 +363,18 @@ class TestAuthenticateUserByCredentials:
 
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_authenticate_user_by_credentials_wrong_password(self):
+    async def test_authenticate_user_by_credentials_wrong_password(
+        self, mock_db, mock_crud_users, bcrypt_hash_cache
+    ):
         """Test authentication with wrong password."""
         mock_user = {
             "id": 1,
             "username": "testuser",
             "email": "test@example.com",
-            "hashed_password": get_password_hash("correct_password"),
+            "hashed_password": bcrypt_hash_cache("correct_password"),
             "is_active": True,
         }
 
-        mock_db = AsyncMock(spec=AsyncSession)
-        mock_crud_users = AsyncMock()
         mock_crud_users.get.return_value = mock_user
 
         result = await authenticate_user_by_credentials(
@@ -458,8 +386,9 @@ class TestAuthenticateUserByCredentials:
 
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_authenticate_user_by_credentials_no_hashed_password(self):
+    async def test_authenticate_user_by_credentials_no_hashed_password(
+        self, mock_db, mock_crud_users
+    ):
         """Test authentication when user has no hashed password."""
         mock_user = {
             "id": 1,
@@ -468,8 +397,6 @@ class TestAuthenticateUserByCredentials:
             "is_active": True,
         }
 
-        mock_db = AsyncMock(spec=AsyncSession)
-        mock_crud_users = AsyncMock()
         mock_crud_users.get.return_value = mock_user
 
         result = await authenticate_user_by_credentials(
@@ -481,11 +408,10 @@ class TestAuthenticateUserByCredentials:
 
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_authenticate_user_by_credentials_empty_credentials(self):
+    async def test_authenticate_user_by_credentials_empty_credentials(
+        self, mock_db, mock_crud_users
+    ):
         """Test authentication with empty credentials."""
-        mock_db = AsyncMock(spec=AsyncSession)
-        mock_crud_users = AsyncMock()
         mock_crud_users.get.return_value = None
 
         result = await authenticate_user_by_credentials(
@@ -497,40 +423,10 @@ class TestAuthenticateUserByCredentials:
 
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_authenticate_user_by_credentials_unicode_credentials(self):
-        """Test authentication with unicode credentials."""
-        username = "tëstüsér"
-        password = "tëst_pàsswörd_🔐"
-        hashed_password = get_password_hash(password)
-
-        mock_user = {
-            "id": 1,
-            "username": username,
-            "email": "test@example.com",
-            "hashed_password": hashed_password,
-            "is_active": True,
-        }
-
-        mock_db = AsyncMock(spec=AsyncSession)
-        mock_crud_users = AsyncMock()
-        mock_crud_users.get.return_value = mock_user
-
-        result = await authenticate_user_by_credentials(
-            username_or_email=username,
-            password=password,
-            db=mock_db,
-            crud_users=mock_crud_users,
-        )
-
-        assert result is not None
-        assert result["username"] == username
-
-    @pytest.mark.asyncio
-    async def test_authenticate_user_by_credentials_exception_handling(self):
+    async def test_authenticate_user_by_credentials_exception_handling(
+        self, mock_db, mock_crud_users
+    ):
         """Test authentication exception handling."""
-        mock_db = AsyncMock(spec=AsyncSession)
-        mock_crud_users = AsyncMock()
         mock_crud_users.get.side_effect = Exception("Database error")
 
         result = await authenticate_user_by_credentials(
@@ -542,11 +438,10 @@ class TestAuthenticateUserByCredentials:
 
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_authenticate_user_by_credentials_logging_debug(self, caplog):
+    async def test_authenticate_user_by_credentials_logging_debug(
+        self, mock_db, mock_crud_users, caplog
+    ):
         """Test debug logging during authentication."""
-        mock_db = AsyncMock(spec=AsyncSession)
-        mock_crud_users = AsyncMock()
         mock_crud_users.get.return_value = None
 
         with caplog.at_level(logging.DEBUG):
@@ -561,8 +456,9 @@ class TestAuthenticateUserByCredentials:
         assert "Attempting to authenticate user" in caplog.text
         assert "User not found in database" in caplog.text
 
-    @pytest.mark.asyncio
-    async def test_authenticate_user_by_credentials_convert_user_fails(self):
+    async def test_authenticate_user_by_credentials_convert_user_fails(
+        self, mock_db, mock_crud_users
+    ):
         """Test authentication when convert_user_to_dict fails."""
 
         # Create a user object that will fail conversion but allow basic operations
@@ -589,8 +485,6 @@ class TestAuthenticateUserByCredentials:
                 return object.__getattribute__(self, name)
 
         problematic_user = ProblematicUser()
-        mock_db = AsyncMock(spec=AsyncSession)
-        mock_crud_users = AsyncMock()
         mock_crud_users.get.return_value = problematic_user
 
         result = await authenticate_user_by_credentials(
@@ -1,39 +1,27 @@
-import os
-import tempfile
-from typing import Type
+import inspect
 
 import pytest
 import sqlalchemy.exc
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
-from crudadmin.admin_user.models import create_admin_user
 from crudadmin.core.db import DatabaseConfig, get_default_db_path
 
 
-def create_admin_base() -> Type[DeclarativeBase]:
-    """Create a unique AdminBase class for each test to avoid table conflicts."""
-
-    class AdminBase(DeclarativeBase):
-        pass
-
-    return AdminBase
-
-
-@pytest.mark.asyncio
-async def test_database_config_initialization(async_session):
+async def test_database_config_initialization(
+    async_session, admin_base, admin_user_cls, admin_session_cls, tmp_path
+):
     """Test DatabaseConfig initialization with default settings."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as tmp_file:
-        admin_db_path = tmp_file.name
+    admin_db_path = str(tmp_path / "admin.db")
 
     config = None
     try:
-        admin_base = create_admin_base()
         config = DatabaseConfig(
             base=admin_base,
             session=async_session,
             admin_db_path=admin_db_path,
+            admin_user=admin_user_cls,
+            admin_session=admin_session_cls,
         )
 
         assert config.base == admin_base
@@ -47,42 +35,35 @@ async def test_database_config_initialization(async_session):
     finally:
         if config and hasattr(config, "admin_engine") and config.admin_engine:
             await config.admin_engine.dispose()
-        if os.path.exists(admin_db_path):
-            os.unlink(admin_db_path)
 
 
-@pytest.mark.asyncio
-async def test_database_config_with_custom_models(async_session):
+async def test_database_config_with_custom_models(
+    async_session, admin_base, admin_user_cls, admin_session_cls
+):
     """Test DatabaseConfig with custom admin user and session models."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as tmp_file:
-        admin_db_path = tmp_file.name
-
     config = None
     try:
-        admin_base = create_admin_base()
-        custom_admin_user = create_admin_user(admin_base)
-
         config = DatabaseConfig(
             base=admin_base,
             session=async_session,
-            admin_db_path=admin_db_path,
-            admin_user=custom_admin_user,
+            admin_db_url="sqlite+aiosqlite:///:memory:",
+            admin_user=admin_user_cls,
+            admin_session=admin_session_cls,
         )
 
-        assert config.AdminUser == custom_admin_user
+        assert config.AdminUser == admin_user_cls
+        assert config.AdminSession == admin_session_cls
 
     finally:
         if config and hasattr(config, "admin_engine") and config.admin_engine:
             await config.admin_engine.dispose()
-        if os.path.exists(admin_db_path):
-            os.unlink(admin_db_path)
 
 
-@pytest.mark.asyncio
-async def test_database_config_with_admin_db_url(async_session):
+async def test_database_config_with_admin_db_url(
+    async_session, admin_base, admin_user_cls, admin_session_cls
+):
     """Test DatabaseConfig with explicit admin database URL."""
     admin_db_url = "sqlite+aiosqlite:///:memory:"
-    admin_base = create_admin_base()
 
     config = None
     try:
@@ -90,6 +71,8 @@ async def test_database_config_with_admin_db_url(async_session):
             base=admin_base,
             session=async_session,
             admin_db_url=admin_db_url,
+            admin_user=admin_user_cls,
+            admin_session=admin_session_cls,
         )
 
         assert str(config.admin_engine.url) == admin_db_url
@@ -98,69 +81,79 @@ async def test_database_config_with_admin_db_url(async_session):
             await config.admin_engine.dispose()
 
 
-@pytest.mark.asyncio
-async def test_initialize_admin_db(async_session):
-    """Test admin database initialization."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as tmp_file:
-        admin_db_path = tmp_file.name
+async def test_database_config_with_admin_engine(
+    async_session, admin_base, admin_user_cls, admin_session_cls
+):
+    """Test DatabaseConfig uses an existing admin engine as-is."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
 
-    config = None
     try:
-        admin_base = create_admin_base()
         config = DatabaseConfig(
             base=admin_base,
             session=async_session,
-            admin_db_path=admin_db_path,
+            admin_db_url="sqlite+aiosqlite:///ignored.db",
+            admin_engine=engine,
+            admin_user=admin_user_cls,
+            admin_session=admin_session_cls,
         )
 
-        await config.initialize_admin_db()
+        assert config.admin_engine is engine
+        assert config.admin_session_maker.kw["bind"] is engine
+    finally:
+        await engine.dispose()
+
+
+async def test_database_config_positional_arguments(
+    async_session, admin_base, admin_user_cls, admin_session_cls
+):
+    """Test the admin model arguments keep their positions after admin_db_path."""
+    config = DatabaseConfig(
+        admin_base,
+        async_session,
+        "sqlite+aiosqlite:///:memory:",
+        None,
+        admin_user_cls,
+        admin_session_cls,
+    )
+    try:
+        assert config.AdminUser is admin_user_cls
+        assert config.AdminSession is admin_session_cls
+    finally:
+        await config.admin_engine.dispose()
 
-        # Verify that tables were created by checking if we can query them
-        admin_session = config.get_admin_session()
 
-        # Test that we can create a simple query without errors
-        from sqlalchemy import text
+async def test_initialize_admin_db(shared_admin_config):
+    """Test admin database initialization."""
+    config = shared_admin_config
+    try:
+        await config.initialize_admin_db()
 
-        result = await admin_session.execute(
-            text("SELECT name FROM sqlite_master WHERE type='table'")
-        )
-        tables = [row[0] for row in result.fetchall()]
+        async with config.admin_engine.connect() as conn:
+            tables = await conn.run_sync(
+                lambda sync_conn: sqlalchemy.inspect(sync_conn).get_table_names()
+            )
 
         assert "admin_user" in tables
-        # Note: admin_session table is no longer created as sessions use storage backends
-
-        await admin_session.close()  # Close the session used for querying
 
     finally:
-        if config and hasattr(config, "admin_engine") and config.admin_engine:
-            await config.admin_engine.dispose()
-        if os.path.exists(admin_db_path):
-            os.unlink(admin_db_path)
-
-
-@pytest.mark.asyncio
-async def test_get_admin_session(db_config):
-    """Test getting admin session."""
-    admin_session = db_config.get_admin_session()
-    assert isinstance(admin_session, AsyncSession)
-    await admin_session.close()
+        async with config.admin_engine.begin() as conn:
+            await conn.run_sync(config.base.metadata.drop_all)
 
 
-@pytest.mark.asyncio
-async def test_get_app_session(db_config):
-    """Test getting app session."""
-    app_session = db_config.get_app_session()
-    assert isinstance(app_session, AsyncSession)
+@pytest.mark.parametrize("method", ["get_admin_session", "get_app_session"])
+async def test_get_session(db_config, method):
+    """Test getting the admin and app sessions."""
+    session = getattr(db_config, method)()
+    assert type(session) is AsyncSession
+    await session.close()
 
 
-@pytest.mark.asyncio
 async def test_get_primary_key(db_config, product_model):
     """Test getting primary key of a model."""
     pk = db_config.get_primary_key(product_model)
     assert pk == "id"
 
 
-@pytest.mark.asyncio
 async def test_get_primary_key_info(db_config, product_model):
     """Test getting primary key information of a model."""
     pk_info = db_config.get_primary_key_info(product_model)
@@ -182,22 +175,18 @@ def test_get_default_db_path():
     assert os.path.exists(data_dir)
 
 
-@pytest.mark.asyncio
 async def test_database_config_admin_db_dependency(db_config):
     """Test the admin database dependency function."""
-    async for session in db_config.get_admin_db():
-        assert isinstance(session, AsyncSession)
-        break  # Only test the first yield
+    # Consuming the generator is covered by the get_admin_db tests below.
+    assert inspect.isasyncgenfunction(db_config.get_admin_db)
 
 
-@pytest.mark.asyncio
-async def test_database_config_error_handling():
+async def test_database_config_error_handling(admin_base):
     """Test error handling in database configuration."""
     # Test with invalid database URL
     config = None
     with pytest.raises(sqlalchemy.exc.ArgumentError):
         try:
-            admin_base = create_admin_base()
             config = DatabaseConfig(
                 base=admin_base,
                 session=None,  # Invalid session
@@ -209,21 +198,10 @@ async def test_database_config_error_handling():
                 await config.admin_engine.dispose()
 
 
-@pytest.mark.asyncio
-async def test_database_config_cleanup(async_session):
+async def test_database_config_cleanup(shared_admin_config):
     """Test proper cleanup of database resources."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as tmp_file:
-        admin_db_path = tmp_file.name
-
-    config = None
+    config = shared_admin_config
     try:
-        admin_base = create_admin_base()
-        config = DatabaseConfig(
-            base=admin_base,
-            session=async_session,
-            admin_db_path=admin_db_path,
-        )
-
         # Initialize and use the database
         await config.initialize_admin_db()
         admin_session = config.get_admin_session()
@@ -239,17 +217,14 @@ async def test_database_config_cleanup(async_session):
         assert config.admin_engine.pool is not None
 
     finally:
-        if config and hasattr(config, "admin_engine") and config.admin_engine:
-            await config.admin_engine.dispose()
-            # Now we can check the pool state after dispose
-            if hasattr(config.admin_engine.pool, "checkedout"):
-                assert config.admin_engine.pool.checkedout() == 0
-
-        if os.path.exists(admin_db_path):
-            os.unlink(admin_db_path)
+        # Disposing drops the in-memory database with the pooled connection;
+        # the engine itself stays usable for the rest of the module.
+        await config.admin_engine.dispose()
+        # Now we can check the pool state after dispose
+        if hasattr(config.admin_engine.pool, "checkedout"):
+            assert config.admin_engine.pool.checkedout() == 0
 
 
-@pytest.mark.asyncio
 async def test_get_admin_db_yields_fresh_session_per_request(db_config):
     """Each get_admin_db() call yields its own session (not a shared singleton)."""
     sessions = []
@@ -261,7 +236,6 @@ async def test_get_admin_db_yields_fresh_session_per_request(db_config):
     assert sessions[0] is not sessions[1]
 
 
-@pytest.mark.asyncio
 async def test_get_admin_db_recovers_after_error(db_config):
     """A failed statement in one request must not poison later requests (#65)."""
     with pytest.raises(sqlalchemy.exc.OperationalError):
@@ -1,60 +1,175 @@
+import asyncio
+import sys
 import time
+from collections.abc import Awaitable, Iterable
 from unittest.mock import AsyncMock, patch
 
 import pytest
+import pytest_asyncio
+from pydantic import ValidationError
 
 from crudadmin.core.rate_limiter import (
+    BatchingRateLimiter,
     RateLimitData,
+    RateLimitDecision,
     SimpleRateLimiter,
     create_rate_limiter,
 )
+from crudadmin.session.backends.memory import MemorySessionStorage
+from crudadmin.session.backends.redis import RedisSessionStorage
 from crudadmin.session.storage import get_session_storage
 
+# Keys per increment_many call in the bulk benchmark.
+BULK_KEYS = 1000
+# Median seconds per key allowed for each backend. Roughly 10x what a local run
+# measures (15-20us for memory; fakeredis emulates the Lua script
+# in-process), leaving room for shared CI runners while still catching per-key
+# regressions such as revalidating the stored model.
+BULK_PER_OP_BUDGET = {"memory": 200e-6, "redis": 2e-3}
+
+
+@pytest.fixture(scope="session")
+def shared_memory_storage():
+    """One memory storage for the whole run; tests share it via memory_storage."""
+    return get_session_storage(
+        backend="memory",
+        model_type=RateLimitData,
+        prefix="test_rate_limit:",
+        expiration=60,  # 1 minute
+    )
+
+
+@pytest_asyncio.fixture
+async def memory_storage(shared_memory_storage):
+    """Yield the shared memory storage and clear its keys after the test."""
+    yield shared_memory_storage
+    await shared_memory_storage.delete_pattern(f"{shared_memory_storage.prefix}*")
+
+
+@pytest_asyncio.fixture
+async def redis_storage():
+    """Create a Redis storage backed by an in-process fakeredis server."""
+    fakeredis = pytest.importorskip("fakeredis")
+
+    storage = RedisSessionStorage[RateLimitData](
+        prefix="test_rate_limit:", expiration=60
+    )
+    storage.client = fakeredis.FakeAsyncRedis()
+    yield storage
+    await storage.close()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def redis_pool():
+    """One single-connection fakeredis pool shared by the factory tests."""
+    fakeredis = pytest.importorskip("fakeredis")
+
+    pool = fakeredis.FakeAsyncRedis(max_connections=1).connection_pool
+    yield pool
+    await pool.disconnect()
+
+
+@pytest.fixture(params=["memory", "redis"])
+def limiter_backend(request):
+    """Return create_rate_limiter arguments for each backend."""
+    if request.param == "redis":
+        return {
+            "backend": "redis",
+            "connection_pool": request.getfixturevalue("redis_pool"),
+        }
+    return {"backend": "memory"}
+
+
+@pytest.fixture(params=["memory_storage", "redis_storage"])
+def backend_storage(request):
+    """Yield each rate limit storage backend in turn."""
+    return request.getfixturevalue(request.param)
+
+
+@pytest.fixture(params=["memory", "redis"])
+def benchmark_limiter(request):
+    """Yield a loop, a limiter and its time budget per backend for benchmarks.
+
+    Benchmarks are synchronous, so each limiter gets its own loop that every
+    round runs on; the fakeredis connection stays bound to that loop.
+    """
+    if request.param == "redis":
+        fakeredis = pytest.importorskip("fakeredis")
+        storage = RedisSessionStorage[RateLimitData](
+            prefix="test_rate_limit_bench:", expiration=60
+        )
+        storage.client = fakeredis.FakeAsyncRedis()
+    else:
+        storage = MemorySessionStorage[RateLimitData](
+            prefix="test_rate_limit_bench:", expiration=60
+        )
+
+    loop = asyncio.new_event_loop()
+    limiter = SimpleRateLimiter(storage)
+    yield loop, limiter, BULK_PER_OP_BUDGET[request.param]
+    loop.run_until_complete(limiter.close())
+    loop.close()
+
+
+async def _bulk(limiter: SimpleRateLimiter, keys: list[str]) -> list[int]:
+    return await limiter.increment_many(keys, 1, 300)
+
+
+async def _run_concurrently(coros: Iterable[Awaitable[int]]) -> list[int]:
+    """Run coroutines as concurrent tasks and return their results in order."""
+    if sys.version_info >= (3, 11):
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(coro) for coro in coros]
+        return [task.result() for task in tasks]
+    return await asyncio.gather(*coros)
+
+
+@pytest.fixture
+def rate_limiter(memory_storage):
+    """Create a rate limiter instance for testing."""
+    return SimpleRateLimiter(memory_storage)
+
 
 class TestRateLimitData:
     """Test the RateLimitData model."""
 
     def test_rate_limit_data_initialization(self):
         """Test RateLimitData initialization with default values."""
-        data = RateLimitData(first_attempt=time.time())
+        data = RateLimitData(first_attempt=time.monotonic_ns() // 1_000_000)
         assert data.count == 0
-        assert isinstance(data.first_attempt, float)
+        assert isinstance(data.first_attempt, int)
 
     def test_rate_limit_data_with_values(self):
         """Test RateLimitData initialization with custom values."""
-        current_time = time.time()
+        current_time = time.monotonic_ns() // 1_000_000
         data = RateLimitData(count=5, first_attempt=current_time)
         assert data.count == 5
         assert data.first_attempt == current_time
 
+    def test_rate_limit_data_is_frozen(self):
+        """Test RateLimitData is immutable and hashable."""
+        data = RateLimitData(count=1, first_attempt=0)
+        with pytest.raises(ValidationError):
+            data.count = 2
+        assert hash(data) == hash(RateLimitData(count=1, first_attempt=0))
+
+    def test_rate_limit_data_reads_legacy_seconds(self):
+        """Counters stored as float epoch seconds load as milliseconds."""
+        data = RateLimitData.model_validate_json(
+            b'{"count": 3, "first_attempt": 1734000000.123}'
+        )
+        assert data.count == 3
+        assert data.first_attempt == 1_734_000_000_123
+
 
 class TestSimpleRateLimiter:
     """Test the SimpleRateLimiter class."""
 
-    @pytest.fixture
-    async def memory_storage(self):
-        """Create a memory storage for testing."""
-        storage = get_session_storage(
-            backend="memory",
-            model_type=RateLimitData,
-            prefix="test_rate_limit:",
-            expiration=60,  # 1 minute
-        )
-        yield storage
-        await storage.close()
-
-    @pytest.fixture
-    async def rate_limiter(self, memory_storage):
-        """Create a rate limiter instance for testing."""
-        return SimpleRateLimiter(memory_storage)
-
-    @pytest.mark.asyncio
     async def test_rate_limiter_initialization(self, memory_storage):
         """Test SimpleRateLimiter initialization."""
         rate_limiter = SimpleRateLimiter(memory_storage)
         assert rate_limiter.storage == memory_storage
 
-    @pytest.mark.asyncio
     async def test_increment_first_attempt(self, rate_limiter):
         """Test incrementing a counter for the first time."""
         key = "test_key"
@@ -66,7 +181,6 @@ class TestSimpleRateLimiter:
         count = await rate_limiter.get_count(key)
         assert count == 1
 
-    @pytest.mark.asyncio
     async def test_increment_multiple_attempts(self, rate_limiter):
         """Test incrementing a counter multiple times."""
         key = "test_key"
@@ -87,7 +201,6 @@ class TestSimpleRateLimiter:
         count = await rate_limiter.get_count(key)
         assert count == 3
 
-    @pytest.mark.asyncio
     async def test_increment_custom_value(self, rate_limiter):
         """Test incrementing with custom increment value."""
         key = "test_key"
@@ -104,19 +217,18 @@ class TestSimpleRateLimiter:
         count = await rate_limiter.get_count(key)
         assert count == 8
 
-    @pytest.mark.asyncio
-    async def test_increment_expired_window(self, rate_limiter):
+    async def test_increment_expired_window(self, memory_storage):
         """Test incrementing after the time window has expired."""
+        now = [1_000_000]
+        rate_limiter = SimpleRateLimiter(memory_storage, time_func=lambda: now[0])
         key = "test_key"
 
         # First attempt
         result1 = await rate_limiter.increment(key, 1, 1)  # 1-second window
         assert result1 == 1
 
-        # Wait for window to expire
-        import asyncio
-
-        await asyncio.sleep(1.1)
+        # Move the clock past the window
+        now[0] += 2_000
 
         # Second attempt after expiry should reset counter
         result2 = await rate_limiter.increment(key, 1, 1)
@@ -126,7 +238,59 @@ class TestSimpleRateLimiter:
         count = await rate_limiter.get_count(key)
         assert count == 1
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "elapsed_ms, expected", [(1_000, 4), (120_000, 1)], ids=["open", "expired"]
+    )
+    async def test_increment_legacy_counter(self, memory_storage, elapsed_ms, expected):
+        """A counter written in float seconds keeps counting in its window."""
+        key = "test_key"
+        memory_storage.data[memory_storage.get_key(key)] = (
+            b'{"count": 3, "first_attempt": 1734000000.123}'
+        )
+        rate_limiter = SimpleRateLimiter(
+            memory_storage, time_func=lambda: 1_734_000_000_123 + elapsed_ms
+        )
+
+        assert await rate_limiter.increment(key, 1, 60) == expected
+
+    async def test_increment_unreadable_counter(self):
+        """A counter that fails validation starts a new window, not fail open."""
+        storage = AsyncMock()
+        storage.get.side_effect = ValidationError.from_exception_data(
+            "RateLimitData", []
+        )
+        rate_limiter = SimpleRateLimiter(storage, time_func=lambda: 5_000)
+
+        assert await rate_limiter.increment("key", 1, 60) == 1
+        assert await rate_limiter.get_count("key") == 0
+        storage.create.assert_awaited_once_with(
+            RateLimitData(count=1, first_attempt=5_000),
+            session_id="key",
+            expiration=60,
+        )
+
+    async def test_slow_key_does_not_block_others(self):
+        """A round-trip in flight for one key leaves other keys free to count."""
+        release = asyncio.Event()
+
+        async def get(key, model_type):
+            if key == "slow":
+                await release.wait()
+            return None
+
+        storage = AsyncMock()
+        storage.get.side_effect = get
+        rate_limiter = SimpleRateLimiter(storage, time_func=lambda: 5_000)
+
+        slow = asyncio.ensure_future(rate_limiter.increment("slow", 1, 60))
+        await asyncio.sleep(0)
+        assert await asyncio.wait_for(rate_limiter.increment("fast", 1, 60), 1) == 1
+        assert not slow.done()
+
+        release.set()
+        assert await slow == 1
+        assert not rate_limiter._locks
+
     async def test_delete_key(self, rate_limiter):
         """Test deleting a rate limit key."""
         key = "test_key"
@@ -142,13 +306,11 @@ class TestSimpleRateLimiter:
         count = await rate_limiter.get_count(key)
         assert count == 0
 
-    @pytest.mark.asyncio
     async def test_get_count_nonexistent_key(self, rate_limiter):
         """Test getting count for a non-existent key."""
         count = await rate_limiter.get_count("nonexistent_key")
         assert count == 0
 
-    @pytest.mark.asyncio
     async def test_multiple_keys(self, rate_limiter):
         """Test rate limiting with multiple keys."""
         key1 = "user:1"
@@ -163,7 +325,6 @@ class TestSimpleRateLimiter:
         assert await rate_limiter.get_count(key1) == 2
         assert await rate_limiter.get_count(key2) == 1
 
-    @pytest.mark.asyncio
     async def test_close(self, rate_limiter):
         """Test closing the rate limiter."""
         # This should not raise an exception
@@ -173,10 +334,9 @@ class TestSimpleRateLimiter:
 class TestCreateRateLimiter:
     """Test the create_rate_limiter factory function."""
 
-    @pytest.mark.asyncio
-    async def test_create_memory_rate_limiter(self):
-        """Test creating a memory-based rate limiter."""
-        rate_limiter = create_rate_limiter("memory", expiration=300)
+    async def test_create_rate_limiter(self, limiter_backend):
+        """Test creating a rate limiter on each backend."""
+        rate_limiter = create_rate_limiter(**limiter_backend, expiration=300)
 
         assert isinstance(rate_limiter, SimpleRateLimiter)
         assert rate_limiter.storage.prefix == "rate_limit:"
@@ -184,26 +344,41 @@ class TestCreateRateLimiter:
 
         await rate_limiter.close()
 
-    @pytest.mark.asyncio
-    async def test_create_rate_limiter_custom_prefix(self):
+    async def test_create_rate_limiter_custom_prefix(self, limiter_backend):
         """Test creating a rate limiter with custom prefix."""
-        rate_limiter = create_rate_limiter("memory", prefix="custom:", expiration=300)
+        rate_limiter = create_rate_limiter(
+            **limiter_backend, prefix="custom:", expiration=300
+        )
 
         assert isinstance(rate_limiter, SimpleRateLimiter)
         assert rate_limiter.storage.prefix == "custom:"
 
         await rate_limiter.close()
 
-    @pytest.mark.asyncio
-    async def test_create_rate_limiter_default_prefix(self):
+    async def test_create_rate_limiter_default_prefix(self, limiter_backend):
         """Test creating a rate limiter with default prefix."""
-        rate_limiter = create_rate_limiter("memory", expiration=300)
+        rate_limiter = create_rate_limiter(**limiter_backend)
 
         assert isinstance(rate_limiter, SimpleRateLimiter)
         assert rate_limiter.storage.prefix == "rate_limit:"
 
         await rate_limiter.close()
 
+    async def test_create_rate_limiter_shared_pool(self, redis_pool):
+        """Test Redis limiters built on one pool share its connection."""
+        first = create_rate_limiter("redis", connection_pool=redis_pool)
+        second = create_rate_limiter("redis", connection_pool=redis_pool)
+
+        assert first.storage.client.connection_pool is redis_pool
+        assert second.storage.client.connection_pool is redis_pool
+
+        await first.increment("pooled", 1, 60)
+        await first.close()
+        assert await second.increment("pooled", 1, 60) == 2
+
+        await second.delete("pooled")
+        await second.close()
+
     def test_create_rate_limiter_invalid_backend(self):
         """Test creating a rate limiter with invalid backend."""
         with pytest.raises(ValueError, match="Unknown backend"):
@@ -213,66 +388,178 @@ class TestCreateRateLimiter:
 class TestRateLimiterIntegration:
     """Integration tests for rate limiter with different backends."""
 
-    @pytest.mark.asyncio
-    async def test_memory_backend_integration(self):
-        """Test rate limiter with memory backend."""
-        rate_limiter = create_rate_limiter("memory", expiration=60)
+    async def test_backend_integration(self, backend_storage):
+        """Test rate limiter against the memory and (fake) Redis backends."""
+        rate_limiter = SimpleRateLimiter(backend_storage)
+
+        # Test basic functionality
+        key = "integration_test"
 
-        try:
-            # Test basic functionality
-            key = "integration_test"
+        result1 = await rate_limiter.increment(key, 1, 60)
+        assert result1 == 1
 
-            result1 = await rate_limiter.increment(key, 1, 60)
-            assert result1 == 1
+        result2 = await rate_limiter.increment(key, 1, 60)
+        assert result2 == 2
 
-            result2 = await rate_limiter.increment(key, 1, 60)
-            assert result2 == 2
+        count = await rate_limiter.get_count(key)
+        assert count == 2
+
+        assert await rate_limiter.increment_many([key, "other"], 3, 60) == [5, 3]
+        assert await rate_limiter.get_counts([key, "other", "missing"]) == [5, 3, 0]
 
-            count = await rate_limiter.get_count(key)
-            assert count == 2
+        await rate_limiter.delete(key)
+        count = await rate_limiter.get_count(key)
+        assert count == 0
 
-            await rate_limiter.delete(key)
-            count = await rate_limiter.get_count(key)
-            assert count == 0
+    async def test_check_and_increment(self, backend_storage):
+        """Test the decision flips to over the limit exactly on call limit + 1."""
+        rate_limiter = SimpleRateLimiter(backend_storage)
+        limit = 5
+
+        for attempt in range(1, limit + 1):
+            decision = await rate_limiter.check_and_increment("decision", limit, 60)
+            assert decision == RateLimitDecision(
+                count=attempt, over_limit=False, retry_after_ms=0
+            )
+
+        decision = await rate_limiter.check_and_increment("decision", limit, 60)
+        assert decision.count == limit + 1
+        assert decision.over_limit is True
+        assert 0 < decision.retry_after_ms <= 60_000
+
+    async def test_check_and_increment_retry_after(self, memory_storage):
+        """Test retry_after_ms counts down to the end of the window."""
+        now = [1_000_000]
+        rate_limiter = SimpleRateLimiter(memory_storage, time_func=lambda: now[0])
+
+        await rate_limiter.check_and_increment("retry", 1, 10)
+        now[0] += 4_000
+        decision = await rate_limiter.check_and_increment("retry", 1, 10)
+
+        assert decision.over_limit is True
+        assert decision.retry_after_ms == 6_000
+
+    async def test_script_loaded_once(self, redis_storage):
+        """Test limiters sharing a Redis client load the counter script once."""
+        client = redis_storage.client
+        limiters = []
+        for _ in range(100):
+            storage = RedisSessionStorage[RateLimitData](
+                prefix="test_rate_limit:", expiration=60
+            )
+            storage.client = client
+            limiters.append(SimpleRateLimiter(storage))
+
+        with patch.object(client, "script_load", wraps=client.script_load) as spy:
+            for i, limiter in enumerate(limiters):
+                assert await limiter.increment(f"limiter_{i}", 1, 60) == 1
+            assert await limiters[0].increment_many(["a", "b"], 1, 60) == [1, 1]
+
+        assert spy.call_count == 1
+
+    async def test_redis_script_reloaded_after_flush(self, redis_storage):
+        """Test a NOSCRIPT error reloads the counter script and retries once."""
+        rate_limiter = SimpleRateLimiter(redis_storage)
+        assert await rate_limiter.increment("flushed", 1, 60) == 1
+
+        await redis_storage.client.script_flush()
+        assert await rate_limiter.increment("flushed", 1, 60) == 2
+
+        await redis_storage.client.script_flush()
+        assert await rate_limiter.increment_many(["flushed", "new"], 1, 60) == [3, 1]
+
+    async def test_redis_counter_expires_with_window(self, redis_storage):
+        """Test the Redis counter gets its window as a TTL on the first hit."""
+        rate_limiter = SimpleRateLimiter(redis_storage)
+
+        await rate_limiter.increment("ttl_test", 1, 60)
+        ttl_ms = await redis_storage.client.pttl("test_rate_limit:ttl_test")
+        assert 0 < ttl_ms <= 60_000
+
+    async def test_redis_legacy_counter_reads_as_zero(self, redis_storage):
+        """Test a JSON counter from an older release reads as 0, not an error."""
+        rate_limiter = SimpleRateLimiter(redis_storage)
+        await redis_storage.client.set(
+            "test_rate_limit:legacy", b'{"count": 3, "first_attempt": 1700000000.0}'
+        )
+        await rate_limiter.increment("current", 2, 60)
 
-        finally:
-            await rate_limiter.close()
+        assert await rate_limiter.get_count("legacy") == 0
+        assert await rate_limiter.get_counts(["legacy", "current", "missing"]) == [
+            0,
+            2,
+            0,
+        ]
+        assert await rate_limiter.increment("legacy", 1, 60) == 1
 
-    @pytest.mark.asyncio
-    async def test_redis_backend_fallback(self):
+    async def test_redis_backend_fallback(self, redis_storage):
         """Test that Redis backend fails gracefully when Redis is unavailable."""
-        # This test assumes Redis is not running
-        with patch(
-            "crudadmin.session.backends.redis.RedisSessionStorage"
-        ) as mock_redis:
-            # Mock Redis to raise connection error
-            mock_storage = AsyncMock()
-            mock_storage.get.side_effect = ConnectionError("Redis unavailable")
-            mock_storage.create.side_effect = ConnectionError("Redis unavailable")
-            mock_storage.update.side_effect = ConnectionError("Redis unavailable")
-            mock_storage.delete.side_effect = ConnectionError("Redis unavailable")
-            mock_redis.return_value = mock_storage
-
-            rate_limiter = create_rate_limiter("redis", host="localhost", port=6379)
-
-            try:
-                # These operations should not raise exceptions
-                # but they won't work properly due to connection issues
-                key = "test_key"
-
-                # The rate limiter should handle the exception gracefully
-                # Note: The actual behavior depends on how the storage handles errors
-                with pytest.raises(ConnectionError):
-                    await rate_limiter.increment(key, 1, 60)
-
-            finally:
-                await rate_limiter.close()
+        from redis.exceptions import ConnectionError as RedisConnectionError
+
+        fakeredis = pytest.importorskip("fakeredis")
+        server = fakeredis.FakeServer()
+        server.connected = False
+        redis_storage.client = fakeredis.FakeAsyncRedis(server=server)
+        rate_limiter = SimpleRateLimiter(redis_storage)
+
+        with pytest.raises(RedisConnectionError):
+            await rate_limiter.increment("test_key", 1, 60)
+
+
+class TestBatchingRateLimiter:
+    """Test coalescing of concurrent increments."""
+
+    async def test_same_key_sent_once(self, redis_storage):
+        """Test 100 simultaneous increments on one key take one round-trip."""
+        rate_limiter = BatchingRateLimiter(redis_storage)
+
+        with patch.object(
+            redis_storage,
+            "increment_counters",
+            wraps=redis_storage.increment_counters,
+        ) as spy:
+            results = await asyncio.gather(
+                *(rate_limiter.increment("batched", 1, 60) for _ in range(100))
+            )
+
+        assert spy.call_count == 1
+        assert sorted(results) == list(range(1, 101))
+        assert await rate_limiter.get_count("batched") == 100
+
+    async def test_counts_split_by_amount(self, redis_storage):
+        """Test each caller gets the count right after its own increment."""
+        rate_limiter = BatchingRateLimiter(redis_storage)
+        await rate_limiter.increment("split", 1, 60)
+
+        results = await asyncio.gather(
+            rate_limiter.increment("split", 2, 60),
+            rate_limiter.increment("split", 3, 60),
+            rate_limiter.increment("other", 5, 60),
+        )
+
+        assert results == [3, 6, 5]
+
+    async def test_close_sends_pending(self, redis_storage):
+        """Test closing the limiter flushes increments still being batched."""
+        rate_limiter = BatchingRateLimiter(redis_storage, batch_window=60)
+        task = asyncio.ensure_future(rate_limiter.increment("closing", 1, 60))
+        await asyncio.sleep(0)
+
+        await rate_limiter.close()
+
+        assert await task == 1
+
+    async def test_memory_backend_not_batched(self, memory_storage):
+        """Test non-Redis backends increment directly."""
+        rate_limiter = BatchingRateLimiter(memory_storage)
+
+        assert await rate_limiter.increment("direct", 1, 60) == 1
+        assert await rate_limiter.increment("direct", 1, 60) == 2
 
 
 class TestRateLimiterErrorHandling:
     """Test error handling in rate limiter."""
 
-    @pytest.mark.asyncio
     async def test_storage_error_handling(self):
         """Test rate limiter behavior when storage operations fail."""
         # Create a mock storage that raises errors
@@ -294,7 +581,6 @@ class TestRateLimiterErrorHandling:
         with pytest.raises(Exception, match="Storage error"):
             await rate_limiter.get_count("key")
 
-    @pytest.mark.asyncio
     async def test_partial_storage_failure(self):
         """Test rate limiter when some storage operations fail."""
         mock_storage = AsyncMock()
@@ -314,59 +600,44 @@ class TestRateLimiterErrorHandling:
 class TestRateLimiterPerformance:
     """Performance-related tests for rate limiter."""
 
-    @pytest.mark.asyncio
-    async def test_concurrent_increments(self):
+    @pytest.mark.parametrize("n", [10, 1000, 10_000])
+    async def test_concurrent_increments(self, rate_limiter, n):
         """Test concurrent increments on the same key."""
-        import asyncio
-
-        rate_limiter = create_rate_limiter("memory", expiration=300)
-
-        try:
-            key = "concurrent_test"
-
-            # Create multiple concurrent increment tasks
-            tasks = []
-            for _ in range(10):
-                task = asyncio.create_task(rate_limiter.increment(key, 1, 300))
-                tasks.append(task)
-
-            # Wait for all tasks to complete
-            results = await asyncio.gather(*tasks)
-
-            # Verify all increments were processed
-            # Note: Due to race conditions, the exact order might vary
-            # but all increments should be unique values from 1 to 10
-            assert len(results) == 10
-            assert len(set(results)) == 10  # All results should be unique
-            assert min(results) == 1
-            assert max(results) == 10
-
-            # Final count should be 10
-            final_count = await rate_limiter.get_count(key)
-            assert final_count == 10
-
-        finally:
-            await rate_limiter.close()
-
-    @pytest.mark.asyncio
-    async def test_many_keys_performance(self):
-        """Test performance with many different keys."""
-        rate_limiter = create_rate_limiter("memory", expiration=300)
-
-        try:
-            # Create many keys
-            num_keys = 100
-            keys = [f"key_{i}" for i in range(num_keys)]
-
-            # Increment each key once
-            for key in keys:
-                result = await rate_limiter.increment(key, 1, 300)
-                assert result == 1
-
-            # Verify all keys have count 1
-            for key in keys:
-                count = await rate_limiter.get_count(key)
-                assert count == 1
-
-        finally:
-            await rate_limiter.close()
+        key = "concurrent_test"
+
+        results = await _run_concurrently(
+            rate_limiter.increment(key, 1, 300) for _ in range(n)
+        )
+
+        # Every increment must see a distinct count, whatever the task order
+        assert len(results) == n
+        assert len(set(results)) == n
+        assert min(results) == 1
+        assert max(results) == n
+
+        final_count = await rate_limiter.get_count(key)
+        assert final_count == n
+
+    @pytest.mark.benchmark(group="rate_limiter", max_time=0.5)
+    def test_bulk_increment(self, benchmark, benchmark_limiter):
+        """Benchmark increment_many over many keys and hold it to a time budget."""
+        loop, limiter, budget = benchmark_limiter
+        keys = [f"key_{i}" for i in range(BULK_KEYS)]
+
+        # The first round also checks correctness; later rounds reuse the keys.
+        results = loop.run_until_complete(_bulk(limiter, keys))
+        assert results == [1] * BULK_KEYS
+
+        benchmark(lambda: loop.run_until_complete(_bulk(limiter, keys)))
+
+        counts = loop.run_until_complete(limiter.get_counts(keys))
+        assert len(set(counts)) == 1 and counts[0] > 1
+
+        # Stats are only collected when benchmarking is enabled (not under xdist).
+        if benchmark.stats is not None:
+            per_op = benchmark.stats.stats.median / BULK_KEYS
+            benchmark.extra_info["ops_per_sec"] = round(1 / per_op)
+            assert per_op < budget, (
+                f"increment_many took {per_op * 1e6:.1f}us per key, "
+                f"budget is {budget * 1e6:.0f}us"
+            )
@@ -0,0 +1,117 @@
+from collections.abc import AsyncGenerator, Callable
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import StaticPool
+
+from crudadmin.admin_interface.crud_admin import CRUDAdmin
+from crudadmin.core.db import DatabaseConfig
+from tests.conftest import map_event_models
+
+ADMIN_SECRET_KEY = "test-secret-key-for-testing-only-32-chars"
+
+
+async def _no_app_session() -> AsyncGenerator[AsyncSession]:
+    """Session dependency for shared admins; their tests never open a session."""
+    raise RuntimeError("admin_factory admins have no application session")
+    yield  # pragma: no cover - makes this an async generator
+
+
+def _build_admin(**overrides: Any) -> CRUDAdmin:
+    class AdminBase(DeclarativeBase):
+        pass
+
+    config_kwargs: dict[str, Any] = {
+        "base": AdminBase,
+        "session": _no_app_session,
+        "admin_db_url": "sqlite+aiosqlite:///:memory:",
+    }
+    if overrides.get("track_events"):
+        config_kwargs.update(map_event_models(AdminBase))
+
+    admin_kwargs: dict[str, Any] = {
+        "session": _no_app_session,
+        "SECRET_KEY": ADMIN_SECRET_KEY,
+        "db_config": DatabaseConfig(**config_kwargs),
+        "setup_on_initialization": False,
+    }
+    admin_kwargs.update(overrides)
+    return CRUDAdmin(**admin_kwargs)
+
+
+@pytest.fixture(scope="session")
+def admin_factory() -> Callable[..., CRUDAdmin]:
+    """Return a builder that makes one CRUDAdmin per distinct set of overrides.
+
+    Admins are built without setup and shared by every test asking for the
+    same overrides, so tests must not mutate them. A test that needs to swap
+    an attribute such as admin_site can copy.copy() one, but the copy still
+    shares containers like models and app with the original; assign it fresh
+    ones before writing to them.
+    """
+    admins: dict[frozenset[tuple[str, str]], CRUDAdmin] = {}
+
+    def make(**overrides: Any) -> CRUDAdmin:
+        # repr() so that unhashable values such as dicts and lists can be keys
+        key = frozenset((name, repr(value)) for name, value in overrides.items())
+        if key not in admins:
+            admins[key] = _build_admin(**overrides)
+        return admins[key]
+
+    return make
+
+
+@pytest.fixture(scope="module")
+def admin_base() -> type[DeclarativeBase]:
+    """One admin declarative base shared by the tests of a module."""
+
+    class AdminBase(DeclarativeBase):
+        pass
+
+    return AdminBase
+
+
+@pytest.fixture
+def fresh_admin_base() -> type[DeclarativeBase]:
+    """A new admin declarative base for tests that need their own metadata."""
+
+    class AdminBase(DeclarativeBase):
+        pass
+
+    return AdminBase
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_admin_engine() -> AsyncGenerator[AsyncEngine]:
+    """One in-memory admin database for tests that only read schema or defaults.
+
+    StaticPool keeps the single connection, and with it the database, alive for
+    the whole run. Tests that create tables or rows use their own engine.
+    """
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def admin_root() -> CRUDAdmin:
+    """A CRUDAdmin mounted at "/" and set up once for the module.
+
+    Tests must not mutate it; patch attributes with monkeypatch instead.
+    """
+    admin = _build_admin(mount_path="/")
+    admin.setup()
+    return admin
+
+
+@pytest.fixture(scope="module")
+def admin_regular() -> CRUDAdmin:
+    """A CRUDAdmin mounted at "/admin", for comparison with admin_root."""
+    return _build_admin(mount_path="/admin")
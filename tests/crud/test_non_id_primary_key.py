@@ -64,23 +64,25 @@ async def test_get_update_delete_with_non_id_pk():
     pk_name = get_primary_key_name(DeploymentJob)
 
     async with AsyncSession(engine) as db:
+        # FastCRUD commits each operation itself.
         await crud.create(db=db, object=JobCreate(name="build"))
-        await db.commit()
 
         # get by the real PK column
         job = await crud.get(db=db, **{pk_name: 1})
         assert job is not None
         assert job["name"] == "build"
 
-        # update by the real PK column
-        await crud.update(db=db, object=JobUpdate(name="deploy"), **{pk_name: 1})
-        await db.commit()
-        job = await crud.get(db=db, **{pk_name: 1})
-        assert job["name"] == "deploy"
+        # update by the real PK column, reading the new row back via RETURNING
+        job = await crud.update(
+            db=db,
+            object=JobUpdate(name="deploy"),
+            return_columns=[pk_name, "name"],
+            **{pk_name: 1},
+        )
+        assert job == {pk_name: 1, "name": "deploy"}
 
         # delete by the real PK column
         await crud.delete(db=db, allow_multiple=False, **{pk_name: 1})
-        await db.commit()
         assert await crud.get(db=db, **{pk_name: 1}) is None
 
     await engine.dispose()
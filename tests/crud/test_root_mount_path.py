@@ -1,46 +1,85 @@
+from types import SimpleNamespace
+from typing import Optional
 from unittest.mock import AsyncMock, Mock
 
 import pytest
-from fastapi import Request, Response
+from fastapi import Response
 from fastapi.responses import RedirectResponse
+from fastapi.templating import Jinja2Templates
+from pydantic import BaseModel
+from sqlalchemy import Column, Integer, String
+from sqlalchemy.orm import DeclarativeBase
 
-from crudadmin import CRUDAdmin
 from crudadmin.admin_interface.middleware.auth import AdminAuthMiddleware
-from tests.crud.test_admin import create_test_db_config
+from crudadmin.admin_interface.model_view import ModelView
 
 
-@pytest.mark.asyncio
-async def test_root_mount_path_middleware_behavior(async_session):
-    """Test that middleware correctly handles root mount path."""
-    secret_key = "test-secret-key-for-testing-only-32-chars"
-    db_config = create_test_db_config(async_session)
-
-    admin = CRUDAdmin(
-        session=async_session,
-        SECRET_KEY=secret_key,
-        mount_path="/",
-        db_config=db_config,
-        setup_on_initialization=False,
+class Base(DeclarativeBase):
+    pass
+
+
+class MountedModel(Base):
+    __tablename__ = "mounted_model"
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+
+
+class MountedModelCreate(BaseModel):
+    name: str
+
+
+class MountedModelUpdate(BaseModel):
+    name: str
+
+
+_TEMPLATES = Jinja2Templates(directory="templates")
+
+
+@pytest.fixture(scope="module")
+def model_view(admin_root) -> ModelView:
+    """A ModelView registered against the root-mounted admin site."""
+    return ModelView(
+        database_config=admin_root.db_config,
+        templates=_TEMPLATES,
+        model=MountedModel,
+        allowed_actions={"view", "create", "update", "delete"},
+        create_schema=MountedModelCreate,
+        update_schema=MountedModelUpdate,
+        admin_site=admin_root.admin_site,
     )
 
-    # Create middleware instance
-    middleware = AdminAuthMiddleware(Mock(), admin)
 
-    # Test that root path requests are processed by middleware
-    mock_request = Mock(spec=Request)
-    mock_request.url.path = "/"
-    mock_call_next = AsyncMock()
+@pytest.fixture(scope="module")
+def auth_middleware(admin_root) -> AdminAuthMiddleware:
+    """AdminAuthMiddleware around a dummy app, guarding the root-mounted admin."""
+    return AdminAuthMiddleware(Mock(), admin_root)
+
+
+def _make_request(path: str, session_id: Optional[str] = None) -> SimpleNamespace:
+    """A request stub with only the attributes AdminAuthMiddleware reads."""
+    return SimpleNamespace(
+        url=SimpleNamespace(path=path),
+        cookies={"session_id": session_id} if session_id else {},
+    )
 
-    # Mock session validation to fail (no session)
-    mock_request.cookies.get.return_value = None
+
+@pytest.mark.asyncio
+async def test_root_mount_path_middleware_behavior(
+    admin_root, auth_middleware, monkeypatch
+):
+    """Test that middleware correctly handles root mount path."""
+    # Test that root path requests are processed by middleware, without a
+    # session cookie so that session validation fails
+    mock_request = _make_request("/")
+    mock_call_next = AsyncMock()
 
     # Mock admin database session
     async def mock_get_admin_db():
         yield Mock()
 
-    admin.db_config.get_admin_db = mock_get_admin_db
+    monkeypatch.setattr(admin_root.db_config, "get_admin_db", mock_get_admin_db)
 
-    result = await middleware.dispatch(mock_request, mock_call_next)
+    result = await auth_middleware.dispatch(mock_request, mock_call_next)
 
     # Should redirect to login for unauthenticated requests
     assert isinstance(result, RedirectResponse)
@@ -50,110 +89,31 @@ async def test_root_mount_path_middleware_behavior(async_session):
 
 
 @pytest.mark.asyncio
-async def test_root_mount_path_login_page_redirect(async_session):
+async def test_root_mount_path_login_page_redirect(admin_root):
     """Test that login page redirects correctly for root mount path."""
-    secret_key = "test-secret-key-for-testing-only-32-chars"
-    db_config = create_test_db_config(async_session)
-
-    admin = CRUDAdmin(
-        session=async_session,
-        SECRET_KEY=secret_key,
-        mount_path="/",
-        db_config=db_config,
-        setup_on_initialization=False,
-    )
-
-    # Mock the admin site
-    admin.setup()
-
     # Test redirect URL generation for login success
-    admin_site = admin.admin_site
+    admin_site = admin_root.admin_site
     dashboard_url = f"{admin_site.get_url_prefix()}/" if admin_site.mount_path else "/"
 
     assert dashboard_url == "/"
 
 
 @pytest.mark.asyncio
-async def test_root_mount_path_model_view_urls(async_session):
+async def test_root_mount_path_model_view_urls(model_view):
     """Test that model view URLs are generated correctly for root mount path."""
-    secret_key = "test-secret-key-for-testing-only-32-chars"
-    db_config = create_test_db_config(async_session)
-
-    admin = CRUDAdmin(
-        session=async_session,
-        SECRET_KEY=secret_key,
-        mount_path="/",
-        db_config=db_config,
-        setup_on_initialization=False,
-    )
-
-    # Create a mock model view
-    from fastapi.templating import Jinja2Templates
-    from pydantic import BaseModel
-    from sqlalchemy import Column, Integer, String
-    from sqlalchemy.orm import declarative_base
-
-    from crudadmin.admin_interface.model_view import ModelView
-
-    Base = declarative_base()
-
-    class TestModel(Base):
-        __tablename__ = "test_model"
-        id = Column(Integer, primary_key=True)
-        name = Column(String)
-
-    class TestCreateSchema(BaseModel):
-        name: str
-
-    class TestUpdateSchema(BaseModel):
-        name: str
-
-    # Mock admin site
-    admin.setup()
-
-    model_view = ModelView(
-        database_config=db_config,
-        templates=Jinja2Templates(directory="templates"),
-        model=TestModel,
-        allowed_actions={"view", "create", "update", "delete"},
-        create_schema=TestCreateSchema,
-        update_schema=TestUpdateSchema,
-        admin_site=admin.admin_site,
-    )
-
     # Test URL prefix generation
     assert model_view.get_url_prefix() == ""
 
-    # Test model list URL would be /TestModel/ (not //TestModel/)
-    expected_url = f"{model_view.get_url_prefix()}/TestModel/"
-    assert expected_url == "/TestModel/"
+    # Test model list URL would be /MountedModel/ (not //MountedModel/)
+    expected_url = f"{model_view.get_url_prefix()}/MountedModel/"
+    assert expected_url == "/MountedModel/"
 
 
 @pytest.mark.asyncio
-async def test_root_mount_path_vs_admin_mount_path_comparison(async_session):
+async def test_root_mount_path_vs_admin_mount_path_comparison(
+    admin_root, admin_regular
+):
     """Test the difference between root mount path and regular admin mount path."""
-    secret_key = "test-secret-key-for-testing-only-32-chars"
-    db_config_root = create_test_db_config(async_session)
-    db_config_admin = create_test_db_config(async_session)
-
-    # Root mount path admin
-    admin_root = CRUDAdmin(
-        session=async_session,
-        SECRET_KEY=secret_key,
-        mount_path="/",
-        db_config=db_config_root,
-        setup_on_initialization=False,
-    )
-
-    # Regular admin mount path
-    admin_regular = CRUDAdmin(
-        session=async_session,
-        SECRET_KEY=secret_key,
-        mount_path="/admin",
-        db_config=db_config_admin,
-        setup_on_initialization=False,
-    )
-
     # Compare mount paths
     assert admin_root.mount_path == ""
     assert admin_regular.mount_path == "admin"
@@ -168,29 +128,14 @@ async def test_root_mount_path_vs_admin_mount_path_comparison(async_session):
 
 
 @pytest.mark.asyncio
-async def test_root_mount_path_middleware_static_files(async_session):
+async def test_root_mount_path_middleware_static_files(auth_middleware):
     """Test that middleware correctly handles static files for root mount path."""
-    secret_key = "test-secret-key-for-testing-only-32-chars"
-    db_config = create_test_db_config(async_session)
-
-    admin = CRUDAdmin(
-        session=async_session,
-        SECRET_KEY=secret_key,
-        mount_path="/",
-        db_config=db_config,
-        setup_on_initialization=False,
-    )
-
-    # Create middleware instance
-    middleware = AdminAuthMiddleware(Mock(), admin)
-
     # Test that static file requests bypass auth
-    mock_request = Mock(spec=Request)
-    mock_request.url.path = "/static/favicon.png"
+    mock_request = _make_request("/static/favicon.png")
     mock_call_next = AsyncMock()
     mock_call_next.return_value = Mock(spec=Response)
 
-    await middleware.dispatch(mock_request, mock_call_next)
+    await auth_middleware.dispatch(mock_request, mock_call_next)
 
     # Should call next without authentication check
     mock_call_next.assert_called_once()
@@ -10,7 +10,7 @@ import uuid
 
 import pytest
 from pydantic import BaseModel
-from sqlalchemy import UUID, Column, DateTime, String, Text, func
+from sqlalchemy import UUID, Column, DateTime, String, Text, func, insert
 from sqlalchemy.orm import DeclarativeBase
 
 from crudadmin.admin_interface.model_view import BulkDeleteRequest
@@ -155,11 +155,10 @@ async def test_uuid_crud_operations(async_session, uuid_model, uuid_test_data):
     from fastcrud import FastCRUD
 
     # Create test data with proper UUID objects
-    for data in uuid_test_data:
-        new_item = uuid_model(
-            id=uuid.UUID(data["id"]), name=data["name"], description=data["description"]
-        )
-        async_session.add(new_item)
+    await async_session.execute(
+        insert(uuid_model),
+        [{**data, "id": uuid.UUID(data["id"])} for data in uuid_test_data],
+    )
     await async_session.commit()
 
     crud = FastCRUD(uuid_model)
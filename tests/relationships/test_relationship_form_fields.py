@@ -1,17 +1,19 @@
 """Foreign-key form fields render as relationship dropdowns (issue #53)."""
 
+from collections.abc import AsyncGenerator
 from unittest.mock import Mock
 
 import pytest
 import pytest_asyncio
 from pydantic import BaseModel
-from sqlalchemy import Column, ForeignKey, Integer, String
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy import Column, ForeignKey, Integer, String, insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from sqlalchemy.orm import DeclarativeBase, relationship
 
 from crudadmin.admin_interface.helper import _get_form_fields_from_schema
 from crudadmin.admin_interface.model_view import ModelView
 from crudadmin.core.db import DatabaseConfig
+from tests.conftest import _isolated_session, _shared_sqlite_engine
 
 
 class Base(DeclarativeBase):
@@ -66,16 +68,22 @@ def _admin_site_stub() -> Mock:
     return site
 
 
-@pytest_asyncio.fixture
-async def seeded_db():
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def seeded_engine() -> AsyncEngine:
+    """Create and seed the form-field tables once for the module."""
+    engine = _shared_sqlite_engine("form_fields", "sqlite+aiosqlite:///:memory:")
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    async with AsyncSession(engine) as db:
-        db.add_all([Author(id=1, name="Tolkien"), Author(id=2, name="Rowling")])
-        await db.commit()
+        await conn.execute(
+            insert(Author), [{"id": 1, "name": "Tolkien"}, {"id": 2, "name": "Rowling"}]
+        )
+    return engine
+
+
+@pytest_asyncio.fixture
+async def seeded_db(seeded_engine) -> AsyncGenerator[AsyncSession]:
+    async with _isolated_session(seeded_engine) as db:
         yield db
-    await engine.dispose()
 
 
 def _make_book_view() -> ModelView:
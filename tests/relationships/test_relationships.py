@@ -1,12 +1,14 @@
 """Tests for relationship detection and display (built on native fastcrud)."""
 
+import functools
+from collections.abc import AsyncGenerator
 from dataclasses import replace
 
 import pytest
 import pytest_asyncio
 from fastcrud import FastCRUD
-from sqlalchemy import Column, ForeignKey, Integer, String
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy import Column, ForeignKey, Integer, String, insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from sqlalchemy.orm import DeclarativeBase, relationship
 
 from crudadmin.admin_interface.relationships import (
@@ -17,6 +19,7 @@ from crudadmin.admin_interface.relationships import (
     load_relationship_options,
     resolve_display_field,
 )
+from tests.conftest import _isolated_session, _shared_sqlite_engine
 
 
 class Base(DeclarativeBase):
@@ -47,19 +50,35 @@ class Standalone(Base):
     value = Column(String)
 
 
-@pytest_asyncio.fixture
-async def session():
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+@functools.cache
+def _crud(model: type[Base]) -> FastCRUD:
+    """One FastCRUD per model; it keeps no per-query state."""
+    return FastCRUD(model)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def seeded_engine() -> AsyncEngine:
+    """Create and seed the relationship tables once for the module."""
+    engine = _shared_sqlite_engine("relationships", "sqlite+aiosqlite:///:memory:")
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    async with AsyncSession(engine) as db:
-        db.add(Author(id=1, name="Tolkien"))
-        db.add(Author(id=2, name="Nobody"))
-        db.add(Book(id=1, title="LOTR", author_id=1))
-        db.add(Book(id=2, title="Hobbit", author_id=1))
-        await db.commit()
+        await conn.execute(
+            insert(Author), [{"id": 1, "name": "Tolkien"}, {"id": 2, "name": "Nobody"}]
+        )
+        await conn.execute(
+            insert(Book),
+            [
+                {"id": 1, "title": "LOTR", "author_id": 1},
+                {"id": 2, "title": "Hobbit", "author_id": 1},
+            ],
+        )
+    return engine
+
+
+@pytest_asyncio.fixture
+async def session(seeded_engine) -> AsyncGenerator[AsyncSession]:
+    async with _isolated_session(seeded_engine) as db:
         yield db
-    await engine.dispose()
 
 
 def test_detect_has_many():
@@ -100,38 +119,33 @@ def test_resolve_display_field_falls_back_when_not_a_column():
     assert resolve_display_field(Author, "does_not_exist") == "id"
 
 
+@pytest.mark.parametrize(
+    "model, relationship_name, pk_value, label, expected",
+    [
+        pytest.param(Author, "books", 1, "title", {"LOTR", "Hobbit"}, id="has_many"),
+        pytest.param(Book, "author", 1, "name", {"Tolkien"}, id="belongs_to"),
+        # An author with no books returns an empty list.
+        pytest.param(Author, "books", 2, "title", set(), id="empty"),
+    ],
+)
 @pytest.mark.asyncio
-async def test_load_related_data_has_many(session):
-    rels = detect_relationships(Author)
-    crud = FastCRUD(Author)
-    books = await load_related_data(crud, session, "id", 1, rels["books"])
-    assert len(books) == 2
-    assert {b["title"] for b in books} == {"LOTR", "Hobbit"}
-
-
-@pytest.mark.asyncio
-async def test_load_related_data_belongs_to(session):
-    rels = detect_relationships(Book)
-    crud = FastCRUD(Book)
-    author = await load_related_data(crud, session, "id", 1, rels["author"])
-    assert len(author) == 1
-    assert author[0]["name"] == "Tolkien"
-
-
-@pytest.mark.asyncio
-async def test_load_related_data_empty(session):
-    """An author with no books returns an empty list."""
-    rels = detect_relationships(Author)
-    crud = FastCRUD(Author)
-    books = await load_related_data(crud, session, "id", 2, rels["books"])
-    assert books == []
+async def test_load_related_data(
+    session, model, relationship_name, pk_value, label, expected
+):
+    rels = detect_relationships(model)
+    rows = await load_related_data(
+        _crud(model), session, "id", pk_value, rels[relationship_name]
+    )
+    assert len(rows) == len(expected)
+    assert {row[label] for row in rows} == expected
 
 
 @pytest.mark.asyncio
 async def test_load_related_data_respects_limit(session):
     rels = detect_relationships(Author)
-    crud = FastCRUD(Author)
-    books = await load_related_data(crud, session, "id", 1, rels["books"], limit=1)
+    books = await load_related_data(
+        _crud(Author), session, "id", 1, rels["books"], limit=1
+    )
     assert len(books) == 1
 
 
@@ -1,5 +1,6 @@
 import hashlib
 import json
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -143,6 +144,62 @@ class TestMemorySessionStorage:
         result = await memory_storage.get_user_sessions(user_id)
         assert set(result) == set(session_ids)
 
+    @pytest.mark.asyncio
+    async def test_create_sweeps_expired_sessions(self, memory_storage):
+        """Test that expired sessions are dropped without being accessed."""
+        for i in range(100):
+            sid = f"expired-{i}"
+            test_data = SessionTestData(user_id=1, session_id=sid)
+            await memory_storage.create(test_data, session_id=sid, expiration=-2)
+
+        live = SessionTestData(user_id=1, session_id="live")
+        await memory_storage.create(live, session_id="live")
+
+        assert list(memory_storage.data) == ["test_session:live"]
+        assert list(memory_storage.expiry) == ["test_session:live"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("operation", ["update", "extend"])
+    async def test_write_sweeps_expired_sessions(self, memory_storage, operation):
+        """Test that updates and extends also drop expired sessions."""
+        live = SessionTestData(user_id=1, session_id="live")
+        await memory_storage.create(live, session_id="live")
+        for i in range(100):
+            sid = f"expired-{i}"
+            test_data = SessionTestData(user_id=1, session_id=sid)
+            await memory_storage.create(test_data, session_id=sid, expiration=-2)
+
+        if operation == "update":
+            assert await memory_storage.update("live", live)
+        else:
+            assert await memory_storage.extend("live")
+
+        assert list(memory_storage.data) == ["test_session:live"]
+        now_bucket = int(datetime.now(timezone.utc).timestamp())
+        assert all(bucket >= now_bucket for bucket in memory_storage._bucket_heap)
+
+    @pytest.mark.asyncio
+    async def test_sweep_only_visits_due_keys(self, memory_storage):
+        """Test that sweep cost depends on due keys, not on the total count."""
+        for i in range(10_000):
+            sid = f"live-{i}"
+            test_data = SessionTestData(user_id=1, session_id=sid)
+            await memory_storage.create(test_data, session_id=sid)
+        # Filed directly: create() would sweep each one before adding the next.
+        expired_at = datetime.now(timezone.utc) - timedelta(seconds=2)
+        for i in range(5):
+            key = memory_storage.get_key(f"expired-{i}")
+            memory_storage.data[key] = b"{}"
+            memory_storage._set_expiry(key, expired_at)
+
+        with patch.object(
+            memory_storage, "_check_expiry", wraps=memory_storage._check_expiry
+        ) as check_expiry:
+            memory_storage._sweep_expired()
+
+        assert check_expiry.call_count == 5
+        assert len(memory_storage.data) == 10_000
+
 
 # Redis Backend Tests
 @pytest.mark.skipif(not REDIS_AVAILABLE, reason="Redis not available")
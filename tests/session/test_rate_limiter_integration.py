@@ -2,6 +2,7 @@ import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
+import pytest_asyncio
 
 from crudadmin.session.manager import SessionManager
 from crudadmin.session.schemas import SessionData
@@ -57,7 +58,7 @@ def create_session_manager_with_rate_limiter(
 class TestSessionManagerRateLimiterIntegration:
     """Test the integration of rate limiter with session manager."""
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def session_manager_memory(self):
         """Create a session manager with memory backend for testing."""
         manager = create_session_manager_with_rate_limiter("memory")
@@ -67,7 +68,7 @@ class TestSessionManagerRateLimiterIntegration:
         if manager.rate_limiter:
             await manager.rate_limiter.close()
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def session_manager_no_rate_limiter(self):
         """Create a session manager without rate limiter for testing."""
         storage = get_session_storage(